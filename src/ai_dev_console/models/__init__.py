@@ -1,17 +1,15 @@
-"""Models package."""
-
-from .client import (
-    AnthropicClient,
-    AWSClient,
-    ContentBlock,
-    ConverseRequest,
-    ConverseResponse,
-    InferenceConfiguration,
-    Message,
-    ModelClient,
-    ModelClientFactory,
-    Role,
-)
+"""Models package.
+
+The client layer (``client.base``, ``client.adapters``) pulls in the vendor
+SDKs, so it is resolved lazily on first attribute access (PEP 562). Set
+``AI_DEV_CONSOLE_EAGER_IMPORT=1`` to resolve every name at import time, e.g.
+in CI to surface deferred import errors early.
+"""
+
+import importlib
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
 from .exceptions import (
     ModelClientError,
     ModelRequestError,
@@ -19,7 +17,22 @@ from .exceptions import (
     ModelValidationError,
 )
 from .model import AIModel, ModelCosts, SupportedModels
-from .vendor import Vendor
+from .vendor import VENDOR_BY_VALUE, Vendor
+
+if TYPE_CHECKING:
+    from .client import (
+        AnthropicClient,
+        AWSClient,
+        BatchingModelClient,
+        ContentBlock,
+        ConverseRequest,
+        ConverseResponse,
+        InferenceConfiguration,
+        Message,
+        ModelClient,
+        ModelClientFactory,
+        Role,
+    )
 
 __all__ = [
     "AIModel",
@@ -30,9 +43,11 @@ __all__ = [
     "ModelRequestError",
     "ModelResponseError",
     "Vendor",
+    "VENDOR_BY_VALUE",
     "ModelClient",
     "AnthropicClient",
     "AWSClient",
+    "BatchingModelClient",
     "ModelClientFactory",
     "Message",
     "ContentBlock",
@@ -41,3 +56,39 @@ __all__ = [
     "ConverseResponse",
     "Role",
 ]
+
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "ModelClient": ("ai_dev_console.models.client", "ModelClient"),
+    "AnthropicClient": ("ai_dev_console.models.client", "AnthropicClient"),
+    "AWSClient": ("ai_dev_console.models.client", "AWSClient"),
+    "BatchingModelClient": ("ai_dev_console.models.client", "BatchingModelClient"),
+    "ModelClientFactory": ("ai_dev_console.models.client", "ModelClientFactory"),
+    "Message": ("ai_dev_console.models.client", "Message"),
+    "ContentBlock": ("ai_dev_console.models.client", "ContentBlock"),
+    "InferenceConfiguration": (
+        "ai_dev_console.models.client",
+        "InferenceConfiguration",
+    ),
+    "ConverseRequest": ("ai_dev_console.models.client", "ConverseRequest"),
+    "ConverseResponse": ("ai_dev_console.models.client", "ConverseResponse"),
+    "Role": ("ai_dev_console.models.client", "Role"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve client-layer exports on first access."""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if os.getenv("AI_DEV_CONSOLE_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        __getattr__(_name)
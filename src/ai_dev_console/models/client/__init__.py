@@ -1,7 +1,12 @@
-"""Client Package"""
+"""Client Package
+
+The request/response types are imported eagerly; the adapters and clients
+are resolved on first access so that importing the types stays cheap.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from .adapters import VendorAdapter
-from .base import AnthropicClient, AWSClient, ModelClient, ModelClientFactory
 from .types import (
     ContentBlock,
     ContentType,
@@ -12,6 +17,16 @@ from .types import (
     Role,
 )
 
+if TYPE_CHECKING:
+    from .adapters import VendorAdapter
+    from .base import (
+        AnthropicClient,
+        AWSClient,
+        BatchingModelClient,
+        ModelClient,
+        ModelClientFactory,
+    )
+
 __all__ = [
     "ContentType",
     "Role",
@@ -24,5 +39,35 @@ __all__ = [
     "ModelClient",
     "AnthropicClient",
     "AWSClient",
+    "BatchingModelClient",
     "ModelClientFactory",
 ]
+
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "VendorAdapter": ("ai_dev_console.models.client.adapters", "VendorAdapter"),
+    "ModelClient": ("ai_dev_console.models.client.base", "ModelClient"),
+    "AnthropicClient": ("ai_dev_console.models.client.base", "AnthropicClient"),
+    "AWSClient": ("ai_dev_console.models.client.base", "AWSClient"),
+    "BatchingModelClient": (
+        "ai_dev_console.models.client.base",
+        "BatchingModelClient",
+    ),
+    "ModelClientFactory": (
+        "ai_dev_console.models.client.base",
+        "ModelClientFactory",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve adapters and clients on first access."""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
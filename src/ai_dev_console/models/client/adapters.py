@@ -1,96 +1,165 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Literal, Union, cast
+import logging
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+    cast,
+)
 
-from ..model import SupportedModels
 from ..vendor import Vendor
 from .types import (
     AnthropicContentBlock,
-    AnthropicImageContent,
     AnthropicMessage,
     AnthropicRequestDict,
-    AnthropicTextContent,
     AWSMessage,
     AWSRequestDict,
     ContentBlock,
     ConverseRequest,
     ConverseResponse,
-    InferenceConfigDict,
     Message,
-    MessageContent,
     Role,
     VendorRequestDict,
+    _ROLE_BY_VALUE,
 )
 
+if TYPE_CHECKING:
+    import anthropic
+    from anthropic.types import TextBlock, ThinkingBlock
+
+logger = logging.getLogger(__name__)
+
+# Wire-format role strings, precomputed to skip enum lookups per message. Role
+# is a str enum, so each string equals the member the message TypedDicts name.
+_ROLE_STR = cast(
+    Dict[Role, Literal[Role.USER, Role.ASSISTANT]],
+    {role: role.value for role in Role},
+)
 
-class VendorAdapter(ABC):
-    """Abstract base class for vendor-specific adapters."""
 
-    @abstractmethod
+@lru_cache(maxsize=64)
+def _supports_thinking(model_id: str) -> bool:
+    """Whether ``model_id`` names a Claude 3.7 model with extended reasoning."""
+    return "claude-3-7" in model_id
+
+
+def _thinking_config(budget_tokens: int) -> Dict[str, Any]:
+    """
+    Extended reasoning payload used by both the Anthropic and Bedrock formats.
+
+    A new dict is returned on every call, since it ends up in caller-visible
+    requests.
+    """
+    return {"type": "enabled", "budget_tokens": budget_tokens}
+
+
+# The request fields below depend only on (model_id, thinking_enabled,
+# thinking_budget). They are built fresh per request rather than cached,
+# because callers may mutate the adapted request, nested dicts included.
+def _anthropic_static_fields(
+    model_id: str, thinking_enabled: bool, thinking_budget: int
+) -> Dict[str, Any]:
+    """Anthropic request fields that are fixed for a model and thinking setup."""
+    fields: Dict[str, Any] = {"model": model_id}
+    if thinking_enabled:
+        # Always add thinking support if it's enabled (even if model doesn't
+        # support it). The API will simply ignore it for unsupported models.
+        # For direct Anthropic API, the thinking field is at the top level.
+        fields["thinking"] = _thinking_config(thinking_budget)
+    return fields
+
+
+def _aws_static_fields(
+    model_id: str, thinking_enabled: bool, thinking_budget: int
+) -> Dict[str, Any]:
+    """Bedrock request fields that are fixed for a model and thinking setup."""
+    fields: Dict[str, Any] = {"modelId": model_id}
+    # Add reasoning config (thinking) for Claude 3.7 models when enabled.
+    # For AWS Bedrock, the parameter is named "reasoning_config".
+    if thinking_enabled and _supports_thinking(model_id):
+        fields["additionalModelRequestFields"] = {
+            "reasoning_config": _thinking_config(thinking_budget)
+        }
+    return fields
+
+
+def _to_anthropic_content(
+    blocks: List[ContentBlock],
+) -> Union[str, List[AnthropicContentBlock]]:
+    """Convert message content, using the plain-string form for a lone text block."""
+    if len(blocks) == 1:
+        block = blocks[0]
+        text = block.text
+        if text and not block.image:
+            return text
+    return _to_anthropic_blocks(blocks)
+
+
+def _to_anthropic_blocks(blocks: List[ContentBlock]) -> List[AnthropicContentBlock]:
+    """Convert content blocks to Anthropic text and image blocks."""
+    converted: List[AnthropicContentBlock] = []
+    for block in blocks:
+        if block.text:
+            converted.append({"type": "text", "text": block.text})
+        if block.image:
+            converted.append(
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": block.image["media_type"],
+                        "data": block.image["data"],
+                    },
+                }
+            )
+    return converted
+
+
+class VendorAdapter:
+    """Base class for vendor-specific adapters."""
+
     def adapt_request(self, request: ConverseRequest) -> VendorRequestDict:
         """Convert our request format to vendor-specific format."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def adapt_response(self, response: Dict[str, Any]) -> ConverseResponse:
         """Convert vendor-specific response to our format."""
-        pass
+        raise NotImplementedError
 
     @staticmethod
     def create(vendor: Vendor) -> "VendorAdapter":
-        """Factory method to create appropriate adapter."""
-        if vendor == Vendor.ANTHROPIC:
-            return AnthropicAdapter()
-        elif vendor == Vendor.AWS:
-            return AWSAdapter()
-        raise ValueError(f"Unsupported vendor: {vendor}")
+        """
+        Factory method to create appropriate adapter.
+
+        Adapters are stateless, so a single instance per vendor is shared.
+        """
+        try:
+            return _ADAPTER_SINGLETONS[vendor]
+        except KeyError:
+            raise ValueError(f"Unsupported vendor: {vendor}") from None
 
 
 class AnthropicAdapter(VendorAdapter):
     """Adapter for Anthropic's API."""
 
+    # (InferenceConfiguration attribute, Anthropic request key); max_tokens is
+    # always sent and stop_sequences copied, so both are handled separately.
+    _INFERENCE_FIELDS = (
+        ("temperature", "temperature"),
+        ("top_p", "top_p"),
+    )
+
     def adapt_request(self, request: ConverseRequest) -> AnthropicRequestDict:
         """Convert to Anthropic's format."""
-        messages: List[AnthropicMessage] = []
-
-        # Use the original model_id - no ARN transformation needed for Anthropic
-        model_id = request.model_id
-
-        for msg in request.messages:
-            if (
-                len(msg.content) == 1
-                and msg.content[0].text
-                and not msg.content[0].image
-            ):
-                content: Union[str, List[AnthropicContentBlock]] = msg.content[0].text
-            else:
-                content_blocks: List[AnthropicContentBlock] = []
-                for block in msg.content:
-                    if block.text:
-                        text_content: AnthropicTextContent = {
-                            "type": "text",
-                            "text": block.text,
-                        }
-                        content_blocks.append(text_content)
-                    if block.image:
-                        image_content: AnthropicImageContent = {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": cast(
-                                    Literal["image/jpeg", "image/png"],
-                                    block.image["media_type"],
-                                ),
-                                "data": block.image["data"],
-                            },
-                        }
-                        content_blocks.append(image_content)
-                content = content_blocks
-
-            message: AnthropicMessage = {
-                "role": cast(Literal[Role.USER, Role.ASSISTANT], msg.role.value),
-                "content": content,
-            }
-            messages.append(message)
+        role_str, to_content = _ROLE_STR, _to_anthropic_content
+        messages: List[AnthropicMessage] = [
+            {"role": role_str[msg.role], "content": to_content(msg.content)}
+            for msg in request.messages
+        ]
 
         # Get max_tokens with null safety
         max_tokens = (
@@ -100,169 +169,228 @@ class AnthropicAdapter(VendorAdapter):
             else 500  # Default value
         )
 
-        adapted: AnthropicRequestDict = {
-            "model": model_id or request.model_id,
-            "messages": messages,
-            "max_tokens": max_tokens,
-        }
+        adapted = cast(
+            AnthropicRequestDict,
+            _anthropic_static_fields(
+                request.model_id, request.thinking_enabled, request.thinking_budget
+            ),
+        )
+        adapted["messages"] = messages
+        adapted["max_tokens"] = max_tokens
 
         # Optional parameters
-        if request.inference_config:
-            if request.inference_config.temperature is not None:
-                adapted["temperature"] = request.inference_config.temperature
-            if request.inference_config.top_p is not None:
-                adapted["top_p"] = request.inference_config.top_p
-            if request.inference_config.stop_sequences is not None:
-                adapted["stop_sequences"] = list(
-                    request.inference_config.stop_sequences
-                )
+        config = request.inference_config
+        if config:
+            for attr, key in self._INFERENCE_FIELDS:
+                value = getattr(config, attr)
+                if value is not None:
+                    adapted[key] = value  # type: ignore[literal-required]
+            if config.stop_sequences is not None:
+                # Copy, so edits to the request don't reach the caller's config
+                adapted["stop_sequences"] = list(config.stop_sequences)
 
         if request.system:
             adapted["system"] = request.system
 
-        # Add thinking/extended reasoning for Claude 3.7 models when enabled
-        if request.thinking_enabled:
-            # Always add thinking support if it's enabled (even if model doesn't support it)
-            # The API will simply ignore it for unsupported models
-
-            # Debug the model ID for troubleshooting
-            model_id_lower = request.model_id.lower()
-            model_supports_3_7 = (
-                "claude-3-7" in model_id_lower
-                or "claude-3.7" in model_id_lower
-                or "claude3.7" in model_id_lower
-                or "claude-3-sonnet" in model_id_lower
+        if request.thinking_enabled and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Enabling thinking for model %s (budget %d tokens)",
+                request.model_id,
+                request.thinking_budget,
             )
 
-            print(
-                f"Anthropic adapter: Enabling thinking for model: {request.model_id} (supports_3_7: {model_supports_3_7})"
-            )
+        return adapted
 
-            # For direct Anthropic API, the thinking field is at the top level
-            adapted["thinking"] = {
-                "type": "enabled",
-                "budget_tokens": request.thinking_budget,
-            }
+    def adapt_response(
+        self, response: Union[Dict[str, Any], "anthropic.types.Message"]
+    ) -> ConverseResponse:
+        """
+        Convert vendor-specific response to our format.
+
+        The SDK's ``Message`` is read attribute by attribute instead of being
+        dumped to a dict first; dict input is still accepted.
+        """
+        if isinstance(response, dict):
+            return self._adapt_response_dict(response)
+
+        block_class = ContentBlock
+        content: List[ContentBlock] = []
+        append = content.append
+        thinking: Optional[Dict[str, Any]] = None
+        for block in response.content:
+            # Dispatch on the type tag; the casts narrow the SDK's block union
+            block_type = block.type
+            if block_type == "text":
+                append(block_class(text=cast("TextBlock", block).text))
+            elif block_type == "thinking":
+                thinking_block = cast("ThinkingBlock", block)
+                thinking = {
+                    "text": thinking_block.thinking,
+                    "signature": thinking_block.signature,
+                }
+                append(block_class(thinking=thinking))
 
-        return adapted
+        usage = response.usage
+        return ConverseResponse(
+            messages=[Message(role=_ROLE_BY_VALUE[response.role], content=content)],
+            stop_reason=response.stop_reason,
+            usage=(
+                {
+                    "input_tokens": usage.input_tokens,
+                    "output_tokens": usage.output_tokens,
+                }
+                if usage is not None
+                else None
+            ),
+            thinking=thinking,
+        )
+
+    def _adapt_response_dict(self, response: Dict[str, Any]) -> ConverseResponse:
+        """Convert a response given as a ``{"messages": [...]}`` dict."""
+        # Bind globals and methods used per message to locals
+        role_from, block_class, get = _ROLE_BY_VALUE, ContentBlock, response.get
+        raw_messages = response["messages"]
 
-    def adapt_response(self, response: Dict[str, Any]) -> ConverseResponse:
-        """Convert vendor-specific response to our format."""
         messages = [
             Message(
-                role=Role(msg["role"]),
+                role=role_from[msg["role"]],
                 content=(
-                    [ContentBlock(text=msg["content"])]
-                    if isinstance(msg["content"], str)
-                    else [ContentBlock(**block) for block in msg["content"]]
+                    [block_class(text=content)]
+                    if isinstance(content := msg["content"], str)
+                    else [
+                        block_class(
+                            text=block.get("text"),
+                            image=block.get("image"),
+                            document=block.get("document"),
+                            thinking=block.get("thinking"),
+                        )
+                        for block in content
+                    ]
                 ),
             )
-            for msg in response["messages"]
+            for msg in raw_messages
         ]
 
-        # Extract thinking content if available in the response
-        thinking_content = None
-        if "thinking" in response:
-            thinking_content = response["thinking"]
-
         return ConverseResponse(
             messages=messages,
-            stop_reason=response.get("stop_reason"),
-            usage=response.get("usage"),
-            metrics=response.get("metrics"),
-            thinking=thinking_content,
+            stop_reason=get("stop_reason"),
+            usage=get("usage"),
+            metrics=get("metrics"),
+            # Extract thinking content if available in the response
+            thinking=get("thinking"),
         )
 
 
 class AWSAdapter(VendorAdapter):
     """Adapter for AWS's API."""
 
+    # (InferenceConfiguration attribute, Bedrock inferenceConfig key);
+    # stop_sequences is copied, so it is handled separately.
+    _INFERENCE_FIELDS = (
+        ("temperature", "temperature"),
+        ("max_tokens", "maxTokens"),
+        ("top_p", "topP"),
+    )
+
     def adapt_request(self, request: ConverseRequest) -> AWSRequestDict:
         """Convert to AWS Bedrock's format."""
+        role_str = _ROLE_STR
         messages: List[AWSMessage] = [
             {
-                "role": cast(Literal[Role.USER, Role.ASSISTANT], msg.role.value),
+                "role": role_str[msg.role],
                 "content": [
-                    {"text": content.text or ""}
-                    for content in msg.content
-                    if content.text is not None
+                    {"text": text}
+                    for text in (content.text for content in msg.content)
+                    if text is not None
                 ],
             }
             for msg in request.messages
         ]
 
-        adapted: AWSRequestDict = {
-            "modelId": request.model_id,
-            "messages": messages,
-        }
-
-        # Add a system message if provided
-        if request.system:
-            adapted["system"] = [{"text": request.system}]
-
-        # Always add inferenceConfig if provided
-        if request.inference_config:
-            inference: InferenceConfigDict = {}
-
-            if request.inference_config.temperature is not None:
-                inference["temperature"] = request.inference_config.temperature
-            if request.inference_config.max_tokens is not None:
-                inference["maxTokens"] = request.inference_config.max_tokens
-            if request.inference_config.top_p is not None:
-                inference["topP"] = request.inference_config.top_p
-            if request.inference_config.stop_sequences is not None:
-                inference["stopSequences"] = list(
-                    request.inference_config.stop_sequences
-                )
-
-            if inference:  # Only add if there are actual values
-                adapted["inferenceConfig"] = inference
-
-        # Add reasoning config (thinking) for Claude 3.7 models when enabled
-        if request.thinking_enabled and "claude-3-7" in request.model_id:
-            # For AWS Bedrock, the parameter is named "reasoning_config"
-            adapted["additionalModelRequestFields"] = {
-                "reasoning_config": {
-                    "type": "enabled",
-                    "budget_tokens": request.thinking_budget,
-                }
+        # Always add inferenceConfig if provided (and non-empty)
+        config = request.inference_config
+        inference: Dict[str, Any] = (
+            {
+                key: value
+                for attr, key in self._INFERENCE_FIELDS
+                if (value := getattr(config, attr)) is not None
             }
+            if config
+            else {}
+        )
+        if config and config.stop_sequences is not None:
+            # Copy, so edits to the request don't reach the caller's config
+            inference["stopSequences"] = list(config.stop_sequences)
+
+        adapted = cast(
+            AWSRequestDict,
+            {
+                **_aws_static_fields(
+                    request.model_id, request.thinking_enabled, request.thinking_budget
+                ),
+                "messages": messages,
+                # Add a system message if provided
+                **({"system": [{"text": request.system}]} if request.system else {}),
+                **({"inferenceConfig": inference} if inference else {}),
+            },
+        )
 
         return adapted
 
     def adapt_response(self, response: Dict[str, Any]) -> ConverseResponse:
         """Convert vendor-specific response to our format."""
-        messages = []
         msg = response["output"]["message"]
+        block_class, get = ContentBlock, response.get
+        content_blocks: List[ContentBlock] = []
+        append = content_blocks.append
 
         for content in msg["content"]:
-            content_blocks = []
             # Handle text blocks
             if "text" in content:
-                content_blocks.append(ContentBlock(text=content["text"]))
+                append(block_class(text=content["text"]))
             # Handle reasoning/thinking content
             elif "reasoningContent" in content:
-                if "reasoningText" in content["reasoningContent"]:
-                    content_blocks.append(
-                        ContentBlock(
-                            thinking={
-                                "text": content["reasoningContent"]["reasoningText"][
-                                    "text"
-                                ]
-                            }
+                reasoning = content["reasoningContent"]
+                if "reasoningText" in reasoning:
+                    append(
+                        block_class(
+                            thinking={"text": reasoning["reasoningText"]["text"]}
                         )
                     )
 
-            if content_blocks:
-                messages.append(Message(role=Role(msg["role"]), content=content_blocks))
+        # Bedrock returns a single message; keep all of its blocks together
+        messages = (
+            [Message(role=_ROLE_BY_VALUE[msg["role"]], content=content_blocks)]
+            if content_blocks
+            else []
+        )
 
         return ConverseResponse(
             messages=messages,
-            stop_reason=response.get("stopReason"),
-            usage=response.get("usage"),
-            metrics=response.get("metrics"),
+            stop_reason=get("stopReason"),
+            usage=get("usage"),
+            metrics=get("metrics"),
         )
 
+    def adapt_stream_event(self, event: Dict[str, Any]) -> Optional[ContentBlock]:
+        """Convert a ConverseStream ``contentBlockDelta`` to a content block."""
+        delta = event.get("contentBlockDelta", {}).get("delta")
+        if delta is None:
+            return None
+        text = delta.get("text")
+        if text:
+            return ContentBlock(text=text)
+        reasoning = delta.get("reasoningContent", {}).get("text")
+        if reasoning:
+            return ContentBlock(thinking={"text": reasoning})
+        return None
+
+
+_ADAPTER_SINGLETONS: Dict[Vendor, VendorAdapter] = {
+    Vendor.ANTHROPIC: AnthropicAdapter(),
+    Vendor.AWS: AWSAdapter(),
+}
+
 
 # The factory function is now redundant since we have VendorAdapter.create
 # Consider removing this function
@@ -1,29 +1,177 @@
-from contextlib import contextmanager
+import sys
+from contextlib import contextmanager, suppress
 from typing import (
+    Callable,
     Dict,
     Any,
+    Iterable,
     Iterator,
+    List,
     Optional,
-    Generator,
-    TypeVar,
-    Generic,
-    ContextManager,
+    Set,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+    cast,
 )
 from abc import ABC, abstractmethod
-import anthropic
-import boto3
-from botocore.config import Config
 
-from ..exceptions import ModelClientError
+from ..exceptions import ModelClientError, ModelRequestError
 from ..model import SupportedModels
 from ..vendor import Vendor
-from .adapters import VendorAdapter
-from .types import ConverseRequest, ConverseResponse
+from .adapters import AnthropicAdapter, AWSAdapter, VendorAdapter
+from .types import ContentBlock, ConverseRequest, ConverseResponse
+
+# The vendor SDKs, and asyncio for the batching client, are slow to import,
+# so they are only loaded by the code paths that need them.
+if TYPE_CHECKING:
+    import asyncio
+
+    import anthropic
+    from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+    import boto3
+
+# Exception events that can appear in a Bedrock ConverseStream event stream
+_BEDROCK_ERRORS = frozenset(
+    {
+        "internalServerException",
+        "modelStreamErrorException",
+        "validationException",
+        "throttlingException",
+        "serviceUnavailableException",
+    }
+)
+
+
+# HTTP statuses worth retrying besides 5xx: timeout, conflict, rate limit
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+# Bedrock error codes that describe transient conditions
+_RETRYABLE_AWS_ERROR_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "ServiceUnavailableException",
+        "InternalServerException",
+        "ModelNotReadyException",
+        "ModelTimeoutException",
+    }
+)
+
+
+def _raise_bedrock_error(event: Dict[str, Any]) -> None:
+    """Raise the first Bedrock exception carried by a stream event."""
+    error_type = next(key for key in event if key in _BEDROCK_ERRORS)
+    raise ModelRequestError(
+        f"AWS Bedrock error: {event[error_type]['message']}",
+        retryable=error_type != "validationException",
+    )
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    return status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+
+
+def _vendor_error_hints(error: Exception) -> Optional[Tuple[Optional[int], bool]]:
+    """
+    ``(status_code, retryable)`` for a vendor SDK error, or None otherwise.
+
+    The SDK modules are looked up in ``sys.modules`` instead of imported: an
+    error can only come from an SDK that is already loaded.
+    """
+    anthropic = sys.modules.get("anthropic")
+    if anthropic is not None and isinstance(error, anthropic.APIError):
+        if isinstance(error, anthropic.APIStatusError):
+            return error.status_code, _is_retryable_status(error.status_code)
+        # Connection failures and timeouts
+        return None, isinstance(error, anthropic.APIConnectionError)
+
+    botocore_exceptions = sys.modules.get("botocore.exceptions")
+    if botocore_exceptions is not None:
+        if isinstance(error, botocore_exceptions.ClientError):
+            status_code = error.response.get("ResponseMetadata", {}).get(
+                "HTTPStatusCode"
+            )
+            code = error.response.get("Error", {}).get("Code")
+            return status_code, code in _RETRYABLE_AWS_ERROR_CODES or (
+                status_code is not None and _is_retryable_status(status_code)
+            )
+        if isinstance(error, botocore_exceptions.BotoCoreError):
+            return None, isinstance(
+                error,
+                (
+                    botocore_exceptions.ConnectionError,
+                    botocore_exceptions.HTTPClientError,
+                ),
+            )
+    return None
+
+
+def _wrap_error(message: str, error: Exception) -> ModelClientError:
+    """
+    Wrap an error raised while talking to a vendor.
+
+    Vendor API errors become ModelRequestError carrying the HTTP status and
+    whether a retry may help, so callers can back off without parsing
+    messages. Anything else becomes a plain ModelClientError.
+    """
+    hints = _vendor_error_hints(error)
+    if hints is None:
+        return ModelClientError(f"{message}: {str(error)}")
+    status_code, retryable = hints
+    return ModelRequestError(
+        f"{message}: {str(error)}", retryable=retryable, status_code=status_code
+    )
+
+
+def _iter_bedrock_stream(
+    events: Iterable[Dict[str, Any]], on_reasoning: Callable[[str], None]
+) -> Iterator[str]:
+    """
+    Yield the assistant's text deltas from a Bedrock ConverseStream.
+
+    Args:
+        events: The ``stream`` of a ``converse_stream`` response
+        on_reasoning: Called with each piece of reasoning text, in order
+
+    Raises:
+        ModelClientError: If the stream carries a Bedrock exception event
+    """
+    is_error_free = _BEDROCK_ERRORS.isdisjoint
+    events = iter(events)
+
+    # Skip ahead to the start of the assistant message; Bedrock only streams
+    # one message per call, so no role check is needed after this.
+    for event in events:
+        message_start = event.get("messageStart")
+        if message_start is not None:
+            if message_start["role"] == "assistant":
+                break
+            continue
+        if not is_error_free(event):
+            _raise_bedrock_error(event)
+
+    for event in events:
+        # Handle content deltas: text chunks, or reasoning when thinking is on
+        delta = event.get("contentBlockDelta", {}).get("delta")
+        if delta is not None:
+            text = delta.get("text")
+            if text:
+                yield text
+            else:
+                reasoning = delta.get("reasoningContent", {}).get("text")
+                if reasoning:
+                    on_reasoning(reasoning)
+
+        # Handle errors
+        if not is_error_free(event):
+            _raise_bedrock_error(event)
 
 
 class ModelClient(ABC):
     """Abstract base class for model clients."""
 
+    __slots__ = ("vendor", "adapter")
+
     def __init__(self, vendor: Vendor, adapter: VendorAdapter):
         """Initialize the model client."""
         self.vendor = vendor
@@ -40,9 +188,7 @@ class ModelClient(ABC):
         pass
 
     @contextmanager
-    def converse_stream(
-        self, request: ConverseRequest
-    ) -> ContextManager[Iterator[str]]:
+    def converse_stream(self, request: ConverseRequest) -> Iterator[Iterator[str]]:
         """
         Stream model responses.
 
@@ -58,10 +204,17 @@ class ModelClient(ABC):
 class AnthropicClient(ModelClient):
     """Client implementation for Anthropic's API."""
 
-    def __init__(self, client: anthropic.Anthropic):
+    __slots__ = ("client", "_async_client", "_stream", "response")
+
+    def __init__(self, client: "anthropic.Anthropic"):
         """Initialize the Anthropic client."""
         super().__init__(Vendor.ANTHROPIC, VendorAdapter.create(Vendor.ANTHROPIC))
         self.client = client
+        # Created on first async call and reused so its connection pool is kept
+        self._async_client: Optional["anthropic.AsyncAnthropic"] = None
+        # Streaming state, set by converse_stream
+        self._stream: Optional[Any] = None
+        self.response: Optional[Any] = None
 
     def converse(self, request: ConverseRequest) -> ConverseResponse:
         """
@@ -80,9 +233,11 @@ class AnthropicClient(ModelClient):
             request.validate()
             adapted_request = self.adapter.adapt_request(request)
             response = self.client.messages.create(**adapted_request)
-            return self.adapter.adapt_response(response.model_dump())
+            return self.adapter.adapt_response(response)
+        except ModelClientError:
+            raise
         except Exception as e:
-            raise ModelClientError(f"Failed to process request: {str(e)}") from e
+            raise _wrap_error("Failed to process request", e) from e
 
     async def converse_async(self, request: ConverseRequest) -> ConverseResponse:
         """
@@ -100,16 +255,40 @@ class AnthropicClient(ModelClient):
         try:
             request.validate()
             adapted_request = self.adapter.adapt_request(request)
-            async with anthropic.AsyncAnthropic() as client:
-                response = await client.messages.create(**adapted_request)
-                return self.adapter.adapt_response(response.model_dump())
+            if self._async_client is None:
+                self._async_client = self._create_async_client()
+            response = await self._async_client.messages.create(**adapted_request)
+            return self.adapter.adapt_response(response)
+        except ModelClientError:
+            raise
         except Exception as e:
-            raise ModelClientError(f"Failed to process async request: {str(e)}") from e
+            raise _wrap_error("Failed to process async request", e) from e
+
+    def _create_async_client(self) -> "anthropic.AsyncAnthropic":
+        """Create the async client with the sync client's settings."""
+        import anthropic
+
+        # The SDK's default HTTP client already keeps up to 100 connections
+        # alive, so reusing this one instance is what avoids new handshakes.
+        client = self.client
+        return anthropic.AsyncAnthropic(
+            api_key=client.api_key,
+            auth_token=client.auth_token,
+            base_url=client.base_url,
+            timeout=client.timeout,
+            max_retries=client.max_retries,
+            default_headers=client._custom_headers,
+            default_query=client._custom_query,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared async client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
 
     @contextmanager
-    def converse_stream(
-        self, request: ConverseRequest
-    ) -> ContextManager[Iterator[str]]:
+    def converse_stream(self, request: ConverseRequest) -> Iterator[Iterator[str]]:
         """Stream response from Anthropic's API."""
         try:
             request.validate()
@@ -118,36 +297,61 @@ class AnthropicClient(ModelClient):
             with self.client.messages.stream(**adapted_request) as stream:
                 # Store the stream object so its response can be accessed later
                 self._stream = stream
+                yield self._generate_text(stream)
 
-                def generate() -> str:
-                    for chunk in stream.text_stream:
-                        if chunk:
-                            yield chunk
-                    # After streaming completes, try to store the full response
-                    # using method appropriate for the stream object
-                    if hasattr(stream, "response"):
-                        self.response = stream.response
-                    elif hasattr(stream, "get_final_message"):
-                        self.response = stream.get_final_message()
-
-                yield generate()
-
+        except ModelClientError:
+            raise
         except Exception as e:
-            raise ModelClientError(f"Streaming failed: {str(e)}")
+            raise _wrap_error("Streaming failed", e) from e
+
+    def _generate_text(self, stream: Any) -> Iterator[str]:
+        """Yield the non-empty text chunks, then store the full response."""
+        for chunk in stream.text_stream:
+            if chunk:
+                yield chunk
+        # After streaming completes, try to store the full response
+        # using method appropriate for the stream object
+        if hasattr(stream, "response"):
+            self.response = stream.response
+        elif hasattr(stream, "get_final_message"):
+            self.response = stream.get_final_message()
 
 
 class AWSClient(ModelClient):
     """Client implementation for AWS Bedrock's API."""
 
+    __slots__ = (
+        "client",
+        "supported_models",
+        "region",
+        "_account_id",
+        "_raw_response",
+        "_generator",
+        "response",
+    )
+
     def __init__(self, client: "boto3.client"):
         """Initialize the Bedrock client."""
         super().__init__(Vendor.AWS, VendorAdapter.create(Vendor.AWS))
         self.client = client
         self.supported_models = SupportedModels()
 
-        # AWS Account_ID and region
+        # AWS region is local client metadata; the account ID is looked up
+        # lazily (see ``account_id``) because it may need an STS round trip.
         self.region = self.client.meta.region_name
-        self.account_id = get_aws_account_id(client)
+        self._account_id: Optional[str] = None
+
+        # Streaming state, set by converse_stream
+        self._raw_response: Optional[Dict[str, Any]] = None
+        self._generator: Optional[Iterator[str]] = None
+        self.response: Optional[Dict[str, Any]] = None
+
+    @property
+    def account_id(self) -> str:
+        """AWS account ID, only needed to build inference profile ARNs."""
+        if self._account_id is None:
+            self._account_id = get_aws_account_id(self.client)
+        return self._account_id
 
     def _resolve_model_id(self, model_id: str) -> str:
         """Resolve the model ID to its canonical form."""
@@ -184,13 +388,19 @@ class AWSClient(ModelClient):
             adapted_request = self.adapter.adapt_request(request)
             response = self.client.converse(**adapted_request)
             return self.adapter.adapt_response(response)
+        except ModelClientError:
+            raise
         except Exception as e:
-            raise ModelClientError(f"Failed to process request: {str(e)}") from e
+            raise _wrap_error("Failed to process request", e) from e
 
     async def converse_async(self, request: ConverseRequest) -> ConverseResponse:
         """
         Send an asynchronous conversation request to Bedrock's API.
 
+        botocore has no async client, so the blocking call runs in the event
+        loop's default thread pool; concurrent requests overlap their network
+        waits and share the SDK client's connection pool.
+
         Args:
             request: The conversation request
 
@@ -200,12 +410,12 @@ class AWSClient(ModelClient):
         Raises:
             ModelClientError: If the request fails
         """
-        raise NotImplementedError("Async operations not supported for Bedrock")
+        import asyncio
+
+        return await asyncio.to_thread(self.converse, request)
 
     @contextmanager
-    def converse_stream(
-        self, request: ConverseRequest
-    ) -> ContextManager[Iterator[str]]:
+    def converse_stream(self, request: ConverseRequest) -> Iterator[Iterator[str]]:
         """
         Stream response from AWS Bedrock API.
 
@@ -228,78 +438,277 @@ class AWSClient(ModelClient):
             # Store the raw response for later access
             self._raw_response = response
 
-            # Storage for completed message content
-            full_response_text = ""
-            complete_response = {}
-
-            def generate() -> Iterator[str]:
-                nonlocal full_response_text
-                current_role = None
-                self._generator = generate  # Store reference to generator
-
-                for event in response["stream"]:
-                    # Handle message start
-                    if "messageStart" in event:
-                        current_role = event["messageStart"]["role"]
-                        continue
-
-                    # Only process assistant responses
-                    if current_role != "assistant":
-                        continue
-
-                    # Handle content deltas (actual text chunks)
-                    if "contentBlockDelta" in event:
-                        delta = event["contentBlockDelta"]["delta"]
-                        if "text" in delta and delta["text"]:
-                            full_response_text += delta["text"]
-                            yield delta["text"]
-
-                    # Handle message complete - extract any thinking
-                    if "messageComplete" in event:
-                        # Check for content in the message that contains reasoning
-                        if "message" in event["messageComplete"]:
-                            message = event["messageComplete"]["message"]
-                            if "content" in message:
-                                for content_block in message["content"]:
-                                    # Check for reasoningContent which contains the thinking in AWS Bedrock
-                                    if "reasoningContent" in content_block:
-                                        if (
-                                            "reasoningText"
-                                            in content_block["reasoningContent"]
-                                        ):
-                                            complete_response["thinking"] = {
-                                                "text": content_block[
-                                                    "reasoningContent"
-                                                ]["reasoningText"]["text"]
-                                            }
-
-                    # Handle errors
-                    for error_type in [
-                        "internalServerException",
-                        "modelStreamErrorException",
-                        "validationException",
-                        "throttlingException",
-                        "serviceUnavailableException",
-                    ]:
-                        if error_type in event:
-                            raise ModelClientError(
-                                f"AWS Bedrock error: {event[error_type]['message']}"
-                            )
-
-                # After streaming is complete, store the final response
-                complete_response["text"] = full_response_text
-                self.response = complete_response
-
-            yield generate()
+            self._generator = self._generate_text(response)
+            yield self._generator
+        except ModelClientError:
+            raise
         except Exception as e:
-            raise ModelClientError(f"Streaming failed: {str(e)}") from e
+            raise _wrap_error("Streaming failed", e) from e
+
+    def _generate_text(self, response: Dict[str, Any]) -> Iterator[str]:
+        """Yield the streamed text, then store the complete response."""
+        text_parts: List[str] = []
+        reasoning_parts: List[str] = []
+        complete_response: Dict[str, Any] = {}
+
+        append = text_parts.append
+        for text in _iter_bedrock_stream(response["stream"], reasoning_parts.append):
+            append(text)
+            yield text
+
+        # After streaming is complete, store the final response
+        if reasoning_parts:
+            complete_response["thinking"] = {"text": "".join(reasoning_parts)}
+        complete_response["text"] = "".join(text_parts)
+        self.response = complete_response
+
+    @contextmanager
+    def converse_stream_blocks(
+        self, request: ConverseRequest
+    ) -> Iterator[Iterator[ContentBlock]]:
+        """
+        Stream response from AWS Bedrock API as content blocks.
+
+        Unlike ``converse_stream``, reasoning deltas are yielded as they
+        arrive, as ``ContentBlock(thinking=...)``, alongside the text blocks.
+
+        Args:
+            request: The conversation request
+
+        Yields:
+            Iterator[ContentBlock]: Stream of text and thinking blocks
+
+        Raises:
+            ModelClientError: If streaming fails
+        """
+        try:
+            request.validate()
+            adapted_request = self.adapter.adapt_request(request)
+            response = self.client.converse_stream(**adapted_request)
+            self._raw_response = response
+            yield self._generate_blocks(response["stream"])
+        except ModelClientError:
+            raise
+        except Exception as e:
+            raise _wrap_error("Streaming failed", e) from e
+
+    def _generate_blocks(
+        self, events: Iterable[Dict[str, Any]]
+    ) -> Iterator[ContentBlock]:
+        """Yield the content block of every content-carrying stream event."""
+        is_error_free = _BEDROCK_ERRORS.isdisjoint
+        adapt = cast(AWSAdapter, self.adapter).adapt_stream_event
+        for event in events:
+            if not is_error_free(event):
+                _raise_bedrock_error(event)
+            block = adapt(event)
+            if block is not None:
+                yield block
+
+
+_BatchItem = Tuple[ConverseRequest, "asyncio.Future[ConverseResponse]"]
+
+
+class BatchingModelClient(ModelClient):
+    """
+    Submit concurrent ``converse_async`` calls through Anthropic's Message Batches.
+
+    Requests queued within ``max_wait_ms`` of the first one, up to
+    ``max_batch``, are submitted as one Message Batch. That API is meant for
+    offline bulk work: results can take up to 24 hours to arrive, so never
+    use this client interactively. Synchronous and streaming calls go
+    straight to the wrapped client.
+    """
+
+    __slots__ = (
+        "wrapped",
+        "max_batch",
+        "max_wait",
+        "poll_interval",
+        "_queue",
+        "_worker",
+        "_tasks",
+    )
+
+    def __init__(
+        self,
+        wrapped: ModelClient,
+        max_batch: int = 16,
+        max_wait_ms: float = 10.0,
+        poll_interval: float = 60.0,
+    ):
+        """
+        Initialize the batching client.
+
+        Args:
+            wrapped: The AnthropicClient that sends the requests
+            max_batch: Maximum number of requests collected into one batch
+            max_wait_ms: How long to wait for more requests after the first
+            poll_interval: Seconds between Message Batches status checks
+
+        Raises:
+            ValueError: If wrapped is not an AnthropicClient
+        """
+        if not isinstance(wrapped, AnthropicClient):
+            raise ValueError("Message Batches require an AnthropicClient")
+        super().__init__(wrapped.vendor, wrapped.adapter)
+        self.wrapped = wrapped
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.poll_interval = poll_interval
+        self._queue: Optional["asyncio.Queue[_BatchItem]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        # Strong references to in-flight dispatch tasks
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def converse(self, request: ConverseRequest) -> ConverseResponse:
+        """Send a single request through the wrapped client."""
+        return self.wrapped.converse(request)
+
+    @contextmanager
+    def converse_stream(self, request: ConverseRequest) -> Iterator[Iterator[str]]:
+        """Stream a single request through the wrapped client."""
+        with self.wrapped.converse_stream(request) as stream:
+            yield stream
+
+    async def converse_async(self, request: ConverseRequest) -> ConverseResponse:
+        """
+        Queue a request for the next batch and wait for its response.
+
+        Args:
+            request: The conversation request
+
+        Returns:
+            ConverseResponse containing the model's response
+
+        Raises:
+            ModelClientError: If the request fails
+        """
+        import asyncio
+
+        request.validate()
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        if queue is None or self._worker is None or self._worker.done():
+            queue = self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect_batches(queue))
+        future: "asyncio.Future[ConverseResponse]" = loop.create_future()
+        await queue.put((request, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop collecting batches and cancel every request not yet answered."""
+        import asyncio
+
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()[1].cancel()
+            self._queue = None
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect_batches(self, queue: "asyncio.Queue[_BatchItem]") -> None:
+        """Drain the queue into batches and dispatch one task per batch."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = loop.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: List[_BatchItem]) -> None:
+        """Submit a batch of requests and resolve their futures."""
+        import asyncio
+
+        results: List[Union[ConverseResponse, BaseException]]
+        try:
+            results = await self._submit_anthropic_batch(
+                self.wrapped, [request for request, _ in batch]
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            # One exception per caller, so their tracebacks stay separate
+            results = [_wrap_error("Batch request failed", e) for _ in batch]
+
+        for (_, future), result in zip(batch, results):
+            if future.done():  # The caller gave up waiting
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _submit_anthropic_batch(
+        self, client: AnthropicClient, requests: List[ConverseRequest]
+    ) -> List[Union[ConverseResponse, BaseException]]:
+        """Run requests through the Message Batches API and wait for them to end."""
+        import asyncio
+
+        adapter = cast(AnthropicAdapter, client.adapter)
+        batches = client.client.messages.batches
+        batch = await asyncio.to_thread(
+            batches.create,
+            requests=[
+                {
+                    "custom_id": f"request-{i}",
+                    "params": cast(
+                        "MessageCreateParamsNonStreaming", adapter.adapt_request(r)
+                    ),
+                }
+                for i, r in enumerate(requests)
+            ],
+        )
+        while batch.processing_status != "ended":
+            await asyncio.sleep(self.poll_interval)
+            batch = await asyncio.to_thread(batches.retrieve, batch.id)
+
+        entries = await asyncio.to_thread(lambda: list(batches.results(batch.id)))
+        results: Dict[str, Union[ConverseResponse, BaseException]] = {}
+        for entry in entries:
+            result = entry.result
+            if result.type == "succeeded":
+                results[entry.custom_id] = adapter.adapt_response(result.message)
+            else:
+                results[entry.custom_id] = ModelClientError(
+                    f"Batch request {result.type}"
+                )
+        return [
+            results.get(f"request-{i}", ModelClientError("Batch result missing"))
+            for i in range(len(requests))
+        ]
 
 
 class ModelClientFactory:
     """Factory for creating model clients."""
 
     def create_client(
-        self, vendor: Vendor, client: Optional[Any] = None
+        self,
+        vendor: Vendor,
+        client: Optional[Any] = None,
+        batch: bool = False,
+        max_pool_connections: int = 50,
     ) -> ModelClient:
         """
         Create a model client for the specified vendor.
@@ -307,39 +716,113 @@ class ModelClientFactory:
         Args:
             vendor: The vendor to create a client for
             client: Optional pre-configured client (useful for testing)
+            batch: Wrap the client in a BatchingModelClient, which submits
+                concurrent async calls through the offline Message Batches
+                API. Anthropic only.
+            max_pool_connections: Size of the Bedrock HTTP connection pool.
+                Callers running concurrent ``converse`` calls, e.g. from a
+                ThreadPoolExecutor, should make it at least their worker
+                count. Ignored for other vendors and when ``client`` is given.
 
         Returns:
             ModelClient instance
 
         Raises:
-            ValueError: If the vendor is not supported
+            ValueError: If the vendor is not supported, or batch is set for a
+                vendor other than Anthropic
         """
-        if vendor == Vendor.ANTHROPIC:
-            if client is not None:
-                return AnthropicClient(client)
-            return AnthropicClient(anthropic.Anthropic())
+        try:
+            make_client = _FACTORIES[vendor]
+        except KeyError:
+            raise ValueError(f"Unsupported vendor: {vendor}") from None
+        model_client = make_client(client, max_pool_connections=max_pool_connections)
+        return BatchingModelClient(model_client) if batch else model_client
+
+
+def _make_anthropic(
+    client: Optional["anthropic.Anthropic"], **_options: Any
+) -> ModelClient:
+    """Create an Anthropic client, building the SDK client if none is given."""
+    global _ANTHROPIC_CLIENT
+    if client is None:
+        if _ANTHROPIC_CLIENT is None:
+            import anthropic
+
+            # Shared by the whole process so its keep-alive pool is reused
+            _ANTHROPIC_CLIENT = anthropic.Anthropic()
+        client = _ANTHROPIC_CLIENT
+    return AnthropicClient(client)
+
+
+def _make_aws(
+    client: Optional["boto3.client"], max_pool_connections: int = 50, **_options: Any
+) -> ModelClient:
+    """Create a Bedrock client, building the SDK client if none is given."""
+    if client is None:
+        import boto3
+
+        # AWS SDK will use default credential chain. The client is shared so
+        # its connection pool is reused, until the default session (and with
+        # it the credentials, e.g. after assuming a role) is replaced.
+        cached = _BEDROCK_CLIENTS.get(max_pool_connections)
+        if cached is not None and cached[0] is boto3.DEFAULT_SESSION:
+            client = cached[1]
+        else:
+            from botocore.config import Config
+
+            client = boto3.client(
+                "bedrock-runtime",
+                config=Config(
+                    max_pool_connections=max_pool_connections,
+                    retries={"mode": "adaptive", "max_attempts": 5},
+                    tcp_keepalive=True,
+                ),
+            )
+            _BEDROCK_CLIENTS[max_pool_connections] = (boto3.DEFAULT_SESSION, client)
+    return AWSClient(client)
+
+
+def _make_openai(client: Optional[Any], **_options: Any) -> ModelClient:
+    # Future implementation
+    raise NotImplementedError("OpenAI client not yet implemented")
 
-        elif vendor == Vendor.AWS:
-            if client is not None:
-                return AWSClient(client)
 
-            # AWS SDK will use default credential chain
-            bedrock_client = boto3.client("bedrock-runtime")
-            return AWSClient(bedrock_client)
+_ANTHROPIC_CLIENT: Optional["anthropic.Anthropic"] = None
 
-        elif vendor == Vendor.OPENAI:
-            # Future implementation
-            raise NotImplementedError("OpenAI client not yet implemented")
+# Shared (default session, bedrock-runtime client) by connection pool size
+_BEDROCK_CLIENTS: Dict[int, Tuple[Any, "boto3.client"]] = {}
 
-        raise ValueError(f"Unsupported vendor: {vendor}")
+_FACTORIES: Dict[Vendor, Callable[..., ModelClient]] = {
+    Vendor.ANTHROPIC: _make_anthropic,
+    Vendor.AWS: _make_aws,
+    Vendor.OPENAI: _make_openai,
+}
 
 
 def get_aws_account_id(client: "boto3.client") -> str:
     """Get the AWS account ID from the STS client."""
+    global _STS_CLIENT
     try:
         # Try to get from client session (Mock)
-        return client._session.get_credentials().get_frozen_credentials().account_id
+        credentials = client._session.get_credentials().get_frozen_credentials()
+        return cast(str, credentials.account_id)
     except (AttributeError, ValueError):
-        # Fall back to STS GetCallerIdentity
-        sts_client = boto3.client("sts")
-        return str(sts_client.get_caller_identity()["Account"])
+        import boto3
+
+        # Fall back to STS GetCallerIdentity. The account only changes when
+        # the default session is replaced, so the STS client and its answer
+        # are cached for the current default session.
+        if _ACCOUNT_ID_CACHE.get("session") is not boto3.DEFAULT_SESSION:
+            _ACCOUNT_ID_CACHE.clear()
+            _STS_CLIENT = None
+        account_id = _ACCOUNT_ID_CACHE.get("id")
+        if account_id is None:
+            if _STS_CLIENT is None:
+                _STS_CLIENT = boto3.client("sts")
+            account_id = str(_STS_CLIENT.get_caller_identity()["Account"])
+            _ACCOUNT_ID_CACHE.update(session=boto3.DEFAULT_SESSION, id=account_id)
+        return account_id
+
+
+_STS_CLIENT: Optional["boto3.client"] = None
+_ACCOUNT_ID_CACHE: Dict[str, Any] = {}
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
 
+from ..exceptions import ModelValidationError
+
 
 # Common Enums and Base Types
 class ContentType(Enum):
@@ -13,14 +14,18 @@ class ContentType(Enum):
     DOCUMENT = "document"
 
 
-class Role(Enum):
-    """Roles in a conversation."""
+class Role(str, Enum):
+    """Roles in a conversation; members compare and serialize as their value."""
 
     USER = "user"
     ASSISTANT = "assistant"
     SYSTEM = "system"
 
 
+# Plain dict lookup for parsing wire-format roles, cheaper than Role(value)
+_ROLE_BY_VALUE: Dict[str, Role] = {role.value: role for role in Role}
+
+
 # Content Block Types
 class TextContent(TypedDict):
     type: Literal["text"]
@@ -158,7 +163,7 @@ class AnthropicRequestDict(TypedDict, total=False):
 VendorRequestDict = Union[AnthropicRequestDict, AWSRequestDict]
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     """Represents a block of content in a message."""
 
@@ -181,7 +186,7 @@ class ContentBlock:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a message in a conversation."""
 
@@ -196,7 +201,27 @@ class Message:
         }
 
 
-@dataclass
+# (attribute, lowest, highest, error if too low, error if too high)
+_NUMERIC_BOUNDS = (
+    (
+        "temperature",
+        0,
+        1,
+        "Temperature must be between 0 and 1",
+        "Temperature must be between 0 and 1",
+    ),
+    ("top_p", 0, 1, "Top P must be between 0 and 1", "Top P must be between 0 and 1"),
+    (
+        "max_tokens",
+        1,
+        64000,
+        "Max tokens must be positive",
+        "Max tokens cannot exceed 64000",
+    ),
+)
+
+
+@dataclass(slots=True)
 class InferenceConfiguration:
     """Configuration for model inference with sensible, cost-effective defaults."""
 
@@ -207,28 +232,22 @@ class InferenceConfiguration:
 
     def validate(self) -> None:
         """Validate inference configuration parameters."""
-        if self.temperature is not None:
-            if not 0 <= self.temperature <= 1:
-                raise ValueError("Temperature must be between 0 and 1")
-
-        if self.top_p is not None:
-            if not 0 <= self.top_p <= 1:
-                raise ValueError("Top P must be between 0 and 1")
-
-        if self.max_tokens is not None:
-            if self.max_tokens <= 0:
-                raise ValueError("Max tokens must be positive")
-            if self.max_tokens > 64000:
-                raise ValueError("Max tokens cannot exceed 64000")
+        for name, low, high, too_low, too_high in _NUMERIC_BOUNDS:
+            value = getattr(self, name)
+            if value is not None:
+                if value < low:
+                    raise ModelValidationError(too_low)
+                if value > high:
+                    raise ModelValidationError(too_high)
 
         if self.stop_sequences is not None:
             if not isinstance(self.stop_sequences, list):
-                raise ValueError("Stop sequences must be a list of strings")
+                raise ModelValidationError("Stop sequences must be a list of strings")
             if not all(isinstance(seq, str) for seq in self.stop_sequences):
-                raise ValueError("All stop sequences must be strings")
+                raise ModelValidationError("All stop sequences must be strings")
 
 
-@dataclass
+@dataclass(slots=True)
 class ConverseRequest:
     """Request for model conversation with intelligent defaults."""
 
@@ -247,30 +266,31 @@ class ConverseRequest:
     def estimate_tokens(self) -> int:
         """Estimate the number of tokens in the request."""
 
-        def count_tokens(text: str) -> int:
-            return max(1, len(text) // 6)
-
-        message_tokens = sum(
-            count_tokens(" ".join(block.text or "" for block in message.content))
-            for message in self.messages
-        )
-        system_tokens = count_tokens(self.system) if self.system else 0
+        # About 6 characters per token, at least 1 token per message. A
+        # message's length is that of its block texts joined by single spaces,
+        # computed without building the joined string.
+        message_tokens = 0
+        for message in self.messages:
+            content = message.content
+            chars = sum(len(text) for block in content if (text := block.text))
+            message_tokens += max(1, (chars + len(content) - 1) // 6)
+        system_tokens = max(1, len(self.system) // 6) if self.system else 0
         return message_tokens + system_tokens
 
     def validate(self) -> None:
         """Validate the entire request."""
         if not self.model_id:
-            raise ValueError("Model ID is required")
+            raise ModelValidationError("Model ID is required")
         if not self.messages:
-            raise ValueError("At least one message is required")
+            raise ModelValidationError("At least one message is required")
         for message in self.messages:
             if not message.content:
-                raise ValueError("Each message must have content")
+                raise ModelValidationError("Each message must have content")
         if self.inference_config:
             self.inference_config.validate()
 
 
-@dataclass
+@dataclass(slots=True)
 class ConverseResponse:
     """Response from model conversation."""
 
@@ -285,7 +305,8 @@ class ConverseResponse:
         """Create a response from a dictionary format."""
         messages = [
             Message(
-                role=Role(msg["role"]),
+                # Role() only runs for unknown values, to raise its ValueError
+                role=_ROLE_BY_VALUE.get(msg["role"]) or Role(msg["role"]),
                 content=[ContentBlock(**block) for block in msg["content"]],
             )
             for msg in data["messages"]
@@ -1,10 +1,29 @@
-class ModelClientError(Exception):
-    """Base exception for model client errors."""
-
-    pass
+from typing import Optional
 
 
-class ModelValidationError(ModelClientError):
+class ModelClientError(Exception):
+    """
+    Base exception for model client errors.
+
+    Attributes:
+        retryable: Whether sending the same request again may succeed,
+            e.g. after throttling or a transient server error
+        status_code: HTTP status code returned by the vendor, if any
+    """
+
+    def __init__(
+        self,
+        message: str = "",
+        *,
+        retryable: bool = False,
+        status_code: Optional[int] = None,
+    ):
+        super().__init__(message)
+        self.retryable = retryable
+        self.status_code = status_code
+
+
+class ModelValidationError(ModelClientError, ValueError):
     """Exception raised for validation errors."""
 
     pass
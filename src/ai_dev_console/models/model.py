@@ -1,12 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from .vendor import Vendor
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelCosts:
     """
     Represents the cost structure for a model in USD.
@@ -18,14 +20,31 @@ class ModelCosts:
 
     input_cost_per_million_tokens: Decimal
     output_cost_per_million_tokens: Decimal
+    # Both costs as integers in units of 10**-digits USD, and the divisor
+    # taking ``tokens * scaled cost`` to units of 10**-5 USD
+    _input_scaled: int = field(init=False, repr=False, compare=False)
+    _output_scaled: int = field(init=False, repr=False, compare=False)
+    _divisor: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate costs are non-negative."""
+        """Validate costs are non-negative and precompute the integer costs."""
         if self.input_cost_per_million_tokens < 0:
             raise ValueError("Input cost cannot be negative")
         if self.output_cost_per_million_tokens < 0:
             raise ValueError("Output cost cannot be negative")
 
+        input_cost = Decimal(self.input_cost_per_million_tokens)
+        output_cost = Decimal(self.output_cost_per_million_tokens)
+        input_exponent = input_cost.as_tuple().exponent
+        output_exponent = output_cost.as_tuple().exponent
+        if not isinstance(input_exponent, int) or not isinstance(output_exponent, int):
+            raise ValueError("Costs must be finite")
+        digits = max(0, -input_exponent, -output_exponent)
+        scale = 10**digits
+        object.__setattr__(self, "_input_scaled", int(input_cost * scale))
+        object.__setattr__(self, "_output_scaled", int(output_cost * scale))
+        object.__setattr__(self, "_divisor", scale * 10)
+
     def calculate_cost(self, input_tokens: int, output_tokens: int) -> Decimal:
         """
         Calculate the cost in USD for a given number of input and output tokens.
@@ -43,17 +62,47 @@ class ModelCosts:
         if input_tokens < 0 or output_tokens < 0:
             raise ValueError("Token counts cannot be negative")
 
-        return (
-            Decimal(input_tokens)
-            * self.input_cost_per_million_tokens
-            / Decimal(1_000_000)
-            + Decimal(output_tokens)
-            * self.output_cost_per_million_tokens
-            / Decimal(1_000_000)
-        ).quantize(Decimal("0.00001"))
+        return _cost(
+            self._input_scaled,
+            self._output_scaled,
+            self._divisor,
+            input_tokens,
+            output_tokens,
+        )
+
+
+@lru_cache(maxsize=4096)
+def _cost(
+    input_scaled: int,
+    output_scaled: int,
+    divisor: int,
+    input_tokens: int,
+    output_tokens: int,
+) -> Decimal:
+    """
+    Cost in USD from integer-scaled costs, see ``ModelCosts``.
+
+    Exact integer math, rounded half to even to 5 decimal places. Cached on
+    the values rather than the instance, so equal costs share entries.
+    """
+    total = input_tokens * input_scaled + output_tokens * output_scaled
+    units, remainder = divmod(total, divisor)
+    twice = 2 * remainder
+    if twice > divisor or (twice == divisor and units & 1):
+        units += 1
+    return Decimal(units).scaleb(-5)
+
+
+@lru_cache(maxsize=None)
+def _costs(input_cost: str, output_cost: str) -> ModelCosts:
+    """Registry prices per million tokens, parsed once and shared."""
+    return ModelCosts(
+        input_cost_per_million_tokens=Decimal(input_cost),
+        output_cost_per_million_tokens=Decimal(output_cost),
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AIModel:
     name: str
     vendor: Vendor
@@ -73,10 +122,7 @@ class AIModel:
         return cls(
             name="claude-3-haiku-20240307",
             vendor=Vendor.ANTHROPIC,
-            costs=ModelCosts(
-                input_cost_per_million_tokens=Decimal("0.25"),
-                output_cost_per_million_tokens=Decimal("1.25"),
-            ),
+            costs=_costs("0.25", "1.25"),
             context_window=200000,
             max_output_tokens=8192,
             supports_vision=True,
@@ -87,7 +133,7 @@ class AIModel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMapping:
     """Maps between canonical model names and vendor-specific identifiers."""
 
@@ -95,147 +141,232 @@ class ModelMapping:
     vendor_ids: Dict[Vendor, str]
 
 
+# The model registry: one entry per model and vendor. Every lookup table below
+# is derived from it, so each model is declared exactly once. Entry order is
+# the order ``available_models`` and ``models_for_vendor`` list models in.
+_MODELS: Tuple[AIModel, ...] = (
+    AIModel(
+        name="claude-3-7-sonnet-20250219",
+        vendor=Vendor.ANTHROPIC,
+        costs=_costs("4.0", "20.0"),
+        context_window=200000,
+        max_output_tokens=8192,
+        supports_vision=True,
+        supports_message_batches=True,
+        training_cutoff=datetime(2025, 2, 19),
+        description="Our most expressive model",
+        comparative_latency="Fast",
+        vendor_model_id="claude-3-7-sonnet-20250219",
+    ),
+    AIModel(
+        name="claude-3-7-sonnet-20250219",
+        vendor=Vendor.AWS,
+        costs=_costs("3.0", "15.0"),
+        context_window=200000,
+        max_output_tokens=64000,
+        supports_vision=True,
+        supports_message_batches=True,
+        training_cutoff=datetime(2025, 2, 19),
+        description="Our most expressive model",
+        comparative_latency="Fastest",
+        vendor_model_id="anthropic.claude-3-7-sonnet-20250219-v1:0",
+    ),
+    AIModel(
+        name="claude-3-5-sonnet-20241022",
+        vendor=Vendor.ANTHROPIC,
+        costs=_costs("3.0", "15.0"),
+        context_window=200000,
+        max_output_tokens=8192,
+        supports_vision=True,
+        supports_message_batches=True,
+        training_cutoff=datetime(2024, 4, 1),
+        description="Our most intelligent model",
+        comparative_latency="Fast",
+        vendor_model_id="claude-3-5-sonnet-20241022",
+    ),
+    AIModel(
+        name="claude-3-5-sonnet-20241022",
+        vendor=Vendor.AWS,
+        costs=_costs("3.0", "15.0"),
+        context_window=200000,
+        max_output_tokens=8192,
+        supports_vision=True,
+        supports_message_batches=True,
+        training_cutoff=datetime(2024, 4, 1),
+        description="Our most intelligent model",
+        comparative_latency="Fast",
+        vendor_model_id="anthropic.claude-3-5-sonnet-20240620-v1:0",
+    ),
+    AIModel(
+        name="claude-3-haiku-20240307",
+        vendor=Vendor.ANTHROPIC,
+        costs=_costs("1.0", "5.0"),
+        context_window=200000,
+        max_output_tokens=8192,
+        supports_vision=False,
+        supports_message_batches=True,
+        training_cutoff=datetime(2024, 7, 1),
+        description="Our fastest model",
+        comparative_latency="Fastest",
+        vendor_model_id="claude-3-haiku-20240307",
+    ),
+    AIModel(
+        name="claude-3-haiku-20240307",
+        vendor=Vendor.AWS,
+        costs=_costs("1.0", "5.0"),
+        context_window=200000,
+        max_output_tokens=8192,
+        supports_vision=False,
+        supports_message_batches=True,
+        training_cutoff=datetime(2024, 7, 1),
+        description="Our fastest model",
+        comparative_latency="Fastest",
+        vendor_model_id="anthropic.claude-3-haiku-20240307-v1:0",
+    ),
+)
+
+_MODELS_REQUIRING_INFERENCE_PROFILES: FrozenSet[str] = frozenset(
+    {
+        "claude-3-7-sonnet-20250219",
+    }
+)
+
+
+def _by_name(models: Tuple[AIModel, ...]) -> Dict[str, Dict[Vendor, AIModel]]:
+    """Group registry entries by canonical name, then vendor."""
+    grouped: Dict[str, Dict[Vendor, AIModel]] = {}
+    for model in models:
+        grouped.setdefault(model.name, {})[model.vendor] = model
+    return grouped
+
+
+# Canonical model name -> vendor -> model
+_MODELS_BY_VENDOR: Mapping[str, Mapping[Vendor, AIModel]] = MappingProxyType(
+    {name: MappingProxyType(models) for name, models in _by_name(_MODELS).items()}
+)
+
+# Canonical model name -> vendor-specific identifiers
+_MODEL_MAPPINGS: Mapping[str, ModelMapping] = MappingProxyType(
+    {
+        name: ModelMapping(
+            canonical_name=name,
+            vendor_ids={
+                vendor: model.vendor_model_id or name
+                for vendor, model in models.items()
+            },
+        )
+        for name, models in _MODELS_BY_VENDOR.items()
+    }
+)
+
+# Maintain backwards compatibility: expose a flat dictionary of default
+# models so existing code (and tests) that iterate over ``available_models``
+# continues to work.  Anthropic versions are preferred when available.
+_AVAILABLE_MODELS: Mapping[str, AIModel] = MappingProxyType(
+    {
+        name: models.get(Vendor.ANTHROPIC, next(iter(models.values())))
+        for name, models in _MODELS_BY_VENDOR.items()
+    }
+)
+
+# Names of the default models that accept images, in registry order
+_VISION_MODELS: Tuple[str, ...] = tuple(
+    name for name, model in _AVAILABLE_MODELS.items() if model.supports_vision
+)
+
+# Vendor -> names of the models it serves, in registry order
+_MODELS_FOR_VENDOR: Mapping[Vendor, Tuple[str, ...]] = MappingProxyType(
+    {
+        vendor: tuple(
+            name
+            for name, mapping in _MODEL_MAPPINGS.items()
+            if vendor in mapping.vendor_ids
+        )
+        for vendor in Vendor
+    }
+)
+
+# Flat (model name, vendor) -> vendor model ID lookup
+_VENDOR_MODEL_IDS: Mapping[Tuple[str, Vendor], str] = MappingProxyType(
+    {
+        (name, vendor): vendor_id
+        for name, mapping in _MODEL_MAPPINGS.items()
+        for vendor, vendor_id in mapping.vendor_ids.items()
+    }
+)
+
+# (model ID, vendor) -> vendor model ID for every ID ``resolve_model_id``
+# accepts: canonical names, and vendor IDs, which resolve to themselves
+_RESOLVED_MODEL_IDS: Mapping[Tuple[str, Vendor], str] = MappingProxyType(
+    {
+        **_VENDOR_MODEL_IDS,
+        **{
+            (vendor_id, vendor): vendor_id
+            for (_, vendor), vendor_id in _VENDOR_MODEL_IDS.items()
+        },
+    }
+)
+
+
+def _by_vendor_id(
+    mappings: Mapping[str, ModelMapping],
+) -> Dict[str, Tuple[str, Vendor]]:
+    """Map each vendor model ID to its canonical name and vendor."""
+    index: Dict[str, Tuple[str, Vendor]] = {}
+    for name, mapping in mappings.items():
+        for vendor, vendor_id in mapping.vendor_ids.items():
+            index.setdefault(vendor_id, (name, vendor))
+    return index
+
+
+# Vendor model ID -> (canonical name, vendor); the first mapping listed wins
+_MODELS_BY_VENDOR_ID: Mapping[str, Tuple[str, Vendor]] = MappingProxyType(
+    _by_vendor_id(_MODEL_MAPPINGS)
+)
+
+
 class SupportedModels:
+    """Read-only view of the model registry, which is built once at import."""
+
+    _instance: Optional["SupportedModels"] = None
+
+    def __new__(cls) -> "SupportedModels":
+        # The registry is immutable, so all callers share one instance
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
     def __init__(self) -> None:
-        self._model_mappings = {
-            "claude-3-7-sonnet-20250219": ModelMapping(
-                canonical_name="claude-3-7-sonnet-20250219",
-                vendor_ids={
-                    Vendor.ANTHROPIC: "claude-3-7-sonnet-20250219",
-                    Vendor.AWS: "anthropic.claude-3-7-sonnet-20250219-v1:0",
-                },
-            ),
-            "claude-3-haiku-20240307": ModelMapping(
-                canonical_name="claude-3-haiku-20240307",
-                vendor_ids={
-                    Vendor.ANTHROPIC: "claude-3-haiku-20240307",
-                    Vendor.AWS: "anthropic.claude-3-haiku-20240307-v1:0",
-                },
-            ),
-            "claude-3-5-sonnet-20241022": ModelMapping(
-                canonical_name="claude-3-5-sonnet-20241022",
-                vendor_ids={
-                    Vendor.ANTHROPIC: "claude-3-5-sonnet-20241022",
-                    Vendor.AWS: "anthropic.claude-3-5-sonnet-20240620-v1:0",
-                },
-            ),
-        }
-
-        self._models_requiring_inference_profiles = {
-            "claude-3-7-sonnet-20250219",
-        }
-
-        # Mapping of canonical model names to vendor specific versions.  Previous
-        # versions of this code attempted to initialise ``available_models`` with
-        # duplicate keys which resulted in the first definitions silently being
-        # overwritten.  The structure below keeps each canonical model only once
-        # and stores the vendor specific variants in a nested dictionary.
-        self._models_by_vendor: Dict[str, Dict[Vendor, AIModel]] = {
-            "claude-3-7-sonnet-20250219": {
-                Vendor.AWS: AIModel(
-                    name="claude-3-7-sonnet-20250219",
-                    vendor=Vendor.AWS,
-                    costs=ModelCosts(
-                        input_cost_per_million_tokens=Decimal("3.0"),
-                        output_cost_per_million_tokens=Decimal("15.0"),
-                    ),
-                    context_window=200000,
-                    max_output_tokens=64000,
-                    supports_vision=True,
-                    supports_message_batches=True,
-                    training_cutoff=datetime(2025, 2, 19),
-                    description="Our most expressive model",
-                    comparative_latency="Fastest",
-                ),
-                Vendor.ANTHROPIC: AIModel(
-                    name="claude-3-7-sonnet-20250219",
-                    vendor=Vendor.ANTHROPIC,
-                    costs=ModelCosts(
-                        input_cost_per_million_tokens=Decimal("4.0"),
-                        output_cost_per_million_tokens=Decimal("20.0"),
-                    ),
-                    context_window=200000,
-                    max_output_tokens=8192,
-                    supports_vision=True,
-                    supports_message_batches=True,
-                    training_cutoff=datetime(2025, 2, 19),
-                    description="Our most expressive model",
-                    comparative_latency="Fast",
-                ),
-            },
-            "claude-3-5-sonnet-20241022": {
-                Vendor.AWS: AIModel(
-                    name="claude-3-5-sonnet-20241022",
-                    vendor=Vendor.AWS,
-                    costs=ModelCosts(
-                        input_cost_per_million_tokens=Decimal("3.0"),
-                        output_cost_per_million_tokens=Decimal("15.0"),
-                    ),
-                    context_window=200000,
-                    max_output_tokens=8192,
-                    supports_vision=True,
-                    supports_message_batches=True,
-                    training_cutoff=datetime(2024, 4, 1),
-                    description="Our most intelligent model",
-                    comparative_latency="Fast",
-                ),
-                Vendor.ANTHROPIC: AIModel(
-                    name="claude-3-5-sonnet-20241022",
-                    vendor=Vendor.ANTHROPIC,
-                    costs=ModelCosts(
-                        input_cost_per_million_tokens=Decimal("3.0"),
-                        output_cost_per_million_tokens=Decimal("15.0"),
-                    ),
-                    context_window=200000,
-                    max_output_tokens=8192,
-                    supports_vision=True,
-                    supports_message_batches=True,
-                    training_cutoff=datetime(2024, 4, 1),
-                    description="Our most intelligent model",
-                    comparative_latency="Fast",
-                ),
-            },
-            "claude-3-haiku-20240307": {
-                Vendor.ANTHROPIC: AIModel(
-                    name="claude-3-haiku-20240307",
-                    vendor=Vendor.ANTHROPIC,
-                    costs=ModelCosts(
-                        input_cost_per_million_tokens=Decimal("1.0"),
-                        output_cost_per_million_tokens=Decimal("5.0"),
-                    ),
-                    context_window=200000,
-                    max_output_tokens=8192,
-                    supports_vision=False,
-                    supports_message_batches=True,
-                    training_cutoff=datetime(2024, 7, 1),
-                    description="Our fastest model",
-                    comparative_latency="Fastest",
-                ),
-                Vendor.AWS: AIModel(
-                    name="claude-3-haiku-20240307",
-                    vendor=Vendor.AWS,
-                    costs=ModelCosts(
-                        input_cost_per_million_tokens=Decimal("1.0"),
-                        output_cost_per_million_tokens=Decimal("5.0"),
-                    ),
-                    context_window=200000,
-                    max_output_tokens=8192,
-                    supports_vision=False,
-                    supports_message_batches=True,
-                    training_cutoff=datetime(2024, 7, 1),
-                    description="Our fastest model",
-                    comparative_latency="Fastest",
-                ),
-            },
-        }
+        self._model_mappings = _MODEL_MAPPINGS
+        self._models_requiring_inference_profiles = _MODELS_REQUIRING_INFERENCE_PROFILES
+        self._models_by_vendor = _MODELS_BY_VENDOR
+        self.available_models = _AVAILABLE_MODELS
+        self._vendor_model_ids = _VENDOR_MODEL_IDS
+        self._resolved_model_ids = _RESOLVED_MODEL_IDS
+        self._models_by_vendor_id = _MODELS_BY_VENDOR_ID
+
+    def models_for_vendor(self, vendor: Vendor) -> List[str]:
+        """
+        List the models a vendor serves.
+
+        Args:
+            vendor (Vendor): The vendor
+
+        Returns:
+            List[str]: Canonical names of the vendor's models
+        """
+        return list(_MODELS_FOR_VENDOR[vendor])
+
+    def models_with_vision(self) -> List[str]:
+        """
+        List the models that accept images.
 
-        # Maintain backwards compatibility: expose a flat dictionary of default
-        # models so existing code (and tests) that iterate over ``available_models``
-        # continues to work.  Anthropic versions are preferred when available.
-        self.available_models: Dict[str, AIModel] = {
-            name: models.get(Vendor.ANTHROPIC, next(iter(models.values())))
-            for name, models in self._models_by_vendor.items()
-        }
+        Returns:
+            List[str]: Canonical names of the vision-capable default models
+        """
+        return list(_VISION_MODELS)
 
     # TODO: This should be part of the client adapter, not part of the model.
     def requires_inference_profile(self, model_name: str) -> bool:
@@ -274,21 +405,39 @@ class SupportedModels:
 
     def get_model(self, model_name: str, vendor: Optional[Vendor] = None) -> AIModel:
         """Get a model by name and optional vendor."""
-        if model_name not in self._models_by_vendor:
-            raise ValueError(f"Model '{model_name}' not found")
-
-        models = self._models_by_vendor[model_name]
-
         if vendor is None:
             # Default to the Anthropic version when available
-            return models.get(Vendor.ANTHROPIC, next(iter(models.values())))
+            default = self.available_models.get(model_name)
+            if default is None:
+                raise ValueError(f"Model '{model_name}' not found")
+            return default
 
-        if vendor not in models:
+        models = self._models_by_vendor.get(model_name)
+        if models is None:
+            raise ValueError(f"Model '{model_name}' not found")
+
+        model = models.get(vendor)
+        if model is None:
             raise ValueError(
                 f"Model '{model_name}' not supported for vendor {vendor.value}"
             )
+        return model
+
+    def try_get_vendor_model_id(self, model_name: str, vendor: Vendor) -> Optional[str]:
+        """
+        Get the vendor-specific model identifier, or None if there is none.
+
+        Prefer this over catching the ValueError from ``get_vendor_model_id``
+        when probing many models, e.g. to list the models a vendor serves.
+
+        Args:
+            model_name (str): The canonical model name
+            vendor (Vendor): The target vendor
 
-        return models[vendor]
+        Returns:
+            Optional[str]: The vendor-specific model identifier, if any
+        """
+        return self._vendor_model_ids.get((model_name, vendor))
 
     def get_vendor_model_id(self, model_name: str, vendor: Vendor) -> str:
         """
@@ -305,20 +454,14 @@ class SupportedModels:
             - ValueError: Model {model_name} not supported for vendor {vendor}
             - ValueError: No mapping found for model {model_name} and vendor {vendor}
         """
-        # Always check the mapping first
-        mapping = self._model_mappings.get(model_name)
-        if mapping:
-            if vendor in mapping.vendor_ids:
-                return mapping.vendor_ids[vendor]
+        vendor_id = self.try_get_vendor_model_id(model_name, vendor)
+        if vendor_id is not None:
+            return vendor_id
+
+        if model_name in self._model_mappings:
             raise ValueError(
                 f"Model '{model_name}' not supported for vendor {vendor.value}"
             )
-
-        # If no mapping exists, check if it's a valid model for the requested vendor
-        model = self.available_models.get(model_name)
-        if model and model.vendor == vendor:
-            return model_name
-
         raise ValueError(
             f"No mapping found for model '{model_name}' and vendor {vendor.value}"
         )
@@ -335,14 +478,11 @@ class SupportedModels:
         Returns:
             The vendor-specific identifier.
         """
+        resolved = self._resolved_model_ids.get((model_id, vendor))
+        if resolved is not None:
+            return resolved
 
-        # If ``model_id`` already matches a known vendor specific ID for the
-        # requested vendor, return it unchanged.
-        for mapping in self._model_mappings.values():
-            if mapping.vendor_ids.get(vendor) == model_id:
-                return model_id
-
-        # Otherwise treat ``model_id`` as a canonical name and resolve normally.
+        # Unknown ID: raise the same errors as for an unknown canonical name
         return self.get_vendor_model_id(model_id, vendor)
 
     def resolve_model_name_and_vendor(
@@ -369,15 +509,14 @@ class SupportedModels:
             return model_id, None  # Return canonical name, but can't determine vendor
 
         # Check if the model_id is a vendor-specific ID
-        for canonical_name, mapping in self._model_mappings.items():
-            for vendor, vendor_id in mapping.vendor_ids.items():
-                if vendor_id == model_id:
-                    return canonical_name, vendor
+        match = self._models_by_vendor_id.get(model_id)
+        if match is not None:
+            return match
 
         # If no match found, check the available models directly
-        for name, model in self.available_models.items():
-            if name == model_id:
-                return name, model.vendor
+        model = self.available_models.get(model_id)
+        if model is not None:
+            return model_id, model.vendor
 
         # If we get here, we couldn't resolve the model_id
         raise ValueError(f"Unable to resolve model ID: {model_id}")
@@ -1,9 +1,23 @@
-from enum import Enum, auto
+from enum import Enum, unique
+from types import MappingProxyType
+from typing import Mapping
 
 
+@unique
 class Vendor(Enum):
     """Supported AI model vendors."""
 
     ANTHROPIC = "anthropic"
     AWS = "aws"
     OPENAI = "openai"
+
+    # Members are singletons compared by identity, so hash by identity in C
+    # rather than through Enum.__hash__, a Python-level hash of the name.
+    # Vendors key the registry lookups, e.g. (model name, vendor) tuples.
+    __hash__ = object.__hash__
+
+
+# Plain dict lookup for parsing vendor values, cheaper than Vendor(value)
+VENDOR_BY_VALUE: Mapping[str, Vendor] = MappingProxyType(
+    {vendor.value: vendor for vendor in Vendor}
+)
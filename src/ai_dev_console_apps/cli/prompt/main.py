@@ -3,23 +3,15 @@ import os
 import sys
 from typing import List, Optional
 
-from ai_dev_console.models import (
-    ContentBlock,
-    ConverseRequest,
-    InferenceConfiguration,
-    Message,
-    ModelClientFactory,
-    Role,
-    Vendor,
-)
-
-
-def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
-    """Parse command-line arguments for the AI prompt tool."""
-    parser = argparse.ArgumentParser(
-        description="Send a prompt to an AI model and get the response",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Values of ai_dev_console.models.Vendor. Kept inline so that --help and
+# argument errors are answered without importing the model registry.
+_VENDOR_CHOICES = ("anthropic", "aws", "openai")
+
+# Built once at import; parse_args does not modify the parser
+_PARSER = argparse.ArgumentParser(
+    description="Send a prompt to an AI model and get the response",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog="""
 Supported Vendors:
     - anthropic
     - aws
@@ -40,30 +32,33 @@ Examples:
     echo "Explain ML" | ai-prompt --vendor aws --model anthropic.claude-3-haiku-20240307 \\
         --temperature 0.7 --max-tokens 1000
         """,
-    )
+)
+
+_PARSER.add_argument(
+    "--vendor",
+    type=str,
+    choices=_VENDOR_CHOICES,
+    required=True,
+    help="AI vendor to use for the model",
+)
 
-    parser.add_argument(
-        "--vendor",
-        type=str,
-        choices=[v.value for v in Vendor],
-        required=True,
-        help="AI vendor to use for the model",
-    )
+_PARSER.add_argument(
+    "--model", type=str, required=True, help="Specific model identifier to use"
+)
 
-    parser.add_argument(
-        "--model", type=str, required=True, help="Specific model identifier to use"
-    )
+# Optional inference configuration parameters
+_PARSER.add_argument(
+    "--temperature", type=float, help="Controls randomness in response (0.0 - 1.0)"
+)
 
-    # Optional inference configuration parameters
-    parser.add_argument(
-        "--temperature", type=float, help="Controls randomness in response (0.0 - 1.0)"
-    )
+_PARSER.add_argument(
+    "--max-tokens", type=int, help="Maximum number of tokens in the response"
+)
 
-    parser.add_argument(
-        "--max-tokens", type=int, help="Maximum number of tokens in the response"
-    )
 
-    return parser.parse_args(args)
+def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments for the AI prompt tool."""
+    return _PARSER.parse_args(args)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -77,6 +72,16 @@ def main(argv: Optional[List[str]] = None) -> int:
         # Parse arguments
         args = parse_arguments(argv)
 
+        from ai_dev_console.models import (
+            VENDOR_BY_VALUE,
+            ContentBlock,
+            ConverseRequest,
+            InferenceConfiguration,
+            Message,
+            ModelClientFactory,
+            Role,
+        )
+
         # Read prompt from stdin
         prompt = os.getenv("DEBUG_INPUT") or sys.stdin.read().strip()
         if not prompt:
@@ -91,7 +96,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             )
 
         # Process and output response
-        vendor = Vendor(args.vendor)
+        vendor = VENDOR_BY_VALUE[args.vendor]
         factory = ModelClientFactory()
         client = factory.create_client(vendor)
 
@@ -102,7 +107,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         )
 
         response = client.converse(request)
-        print(response.messages[-1].content[0].text)
+        print(
+            "".join(block.text for block in response.messages[-1].content if block.text)
+        )
 
         return 0
 
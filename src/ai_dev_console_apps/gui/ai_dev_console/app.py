@@ -4,6 +4,7 @@ import streamlit as st
 from typing import Dict, Any, List, Optional, Iterator
 
 from ai_dev_console.models import (
+    AWSClient,
     Message,
     ContentBlock,
     ConverseRequest,
@@ -53,14 +54,8 @@ def init_session_state() -> None:
 
 def get_available_models(vendor: Vendor) -> List[str]:
     """Get available models for vendor."""
-    models = []
-    for (
-        model_name,
-        model_mapping,
-    ) in st.session_state.supported_models._model_mappings.items():
-        if vendor in model_mapping.vendor_ids:
-            models.append(model_name)
-    return models
+    supported_models: SupportedModels = st.session_state.supported_models
+    return supported_models.models_for_vendor(vendor)
 
 
 def get_sidebar_config() -> Dict[str, Any]:
@@ -355,9 +350,11 @@ def main() -> None:
         st.caption("AWS Client Debug:")
         # Add these fields if you're running AWS client
         aws_client = st.session_state.client
-        if hasattr(aws_client, "region"):
+        # account_id is looked up on first access, so hasattr() would already
+        # make the STS call; check the client type instead
+        is_aws_client = isinstance(aws_client, AWSClient)
+        if is_aws_client:
             st.caption(f"AWS Region: {aws_client.region}")
-        if hasattr(aws_client, "account_id"):
             st.caption(f"AWS Account ID: {aws_client.account_id}")
 
         # Display if the model requires inference profile
@@ -365,7 +362,7 @@ def main() -> None:
         model_name = config["model"]
         if models.requires_inference_profile(model_name):
             st.caption(f"Model requires inference profile: Yes")
-            if hasattr(aws_client, "region") and hasattr(aws_client, "account_id"):
+            if is_aws_client:
                 profile_arn = models.get_inference_profile_arn(
                     model_name, aws_client.region, aws_client.account_id
                 )
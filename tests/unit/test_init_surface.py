@@ -0,0 +1,168 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CHECK_UNIQUE_INITS = REPO_ROOT / "tools" / "check_unique_inits.py"
+
+
+def _loaded_modules(statement: str, **env: str) -> set:
+    """Run ``statement`` in a fresh interpreter and return ``sys.modules``."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **env},
+    )
+    return set(result.stdout.split())
+
+
+class TestImportSurface:
+    """
+    Test suite for the import cost of the public package surface.
+    """
+
+    def test_models_import_does_not_load_vendor_sdks(self):
+        """
+        Story: A CLI user only needs the model registry
+        Given the models package is imported
+        When no client attribute has been accessed
+        Then neither the client layer nor the vendor SDKs should be loaded
+        """
+        modules = _loaded_modules("import ai_dev_console.models")
+
+        assert "ai_dev_console.models.client.base" not in modules
+        assert "anthropic" not in modules
+        assert "boto3" not in modules
+
+    def test_client_layer_import_does_not_load_vendor_sdks(self):
+        """
+        Story: A developer only uses one vendor, or none, in a process
+        Given the client base module is imported
+        When no client has been created yet
+        Then neither vendor SDK should be loaded
+        """
+        modules = _loaded_modules("import ai_dev_console.models.client.base")
+
+        assert "anthropic" not in modules
+        assert "boto3" not in modules
+        assert "botocore" not in modules
+        assert "asyncio" not in modules
+
+    def test_client_types_import_does_not_load_adapters(self):
+        """
+        Story: Test fixtures only need the request/response data classes
+        Given a type imported from the client package
+        When neither adapters nor clients have been accessed
+        Then the adapter and client modules should not be loaded
+        """
+        modules = _loaded_modules("from ai_dev_console.models.client import Message")
+
+        assert "ai_dev_console.models.client.adapters" not in modules
+        assert "ai_dev_console.models.client.base" not in modules
+
+    def test_lazy_names_resolve_on_access(self):
+        """
+        Story: A developer imports a client type from the models package
+        Given the lazy package exports
+        When accessing a client-layer name
+        Then it should resolve to the object defined in the client package
+        """
+        import ai_dev_console.models as models
+        from ai_dev_console.models.client import ModelClientFactory
+
+        assert models.ModelClientFactory is ModelClientFactory
+        assert "ModelClientFactory" in dir(models)
+
+    def test_unknown_attribute_raises(self):
+        """
+        Story: A developer mistypes an export name
+        Given the lazy package exports
+        When accessing a name that does not exist
+        Then an AttributeError should be raised
+        """
+        import ai_dev_console.models as models
+
+        with pytest.raises(AttributeError):
+            models.DoesNotExist
+
+    def test_eager_import_flag_resolves_everything(self):
+        """
+        Story: CI wants deferred import errors surfaced at import time
+        Given AI_DEV_CONSOLE_EAGER_IMPORT=1
+        When the models package is imported
+        Then the client layer should be loaded immediately
+        """
+        modules = _loaded_modules(
+            "import ai_dev_console.models", AI_DEV_CONSOLE_EAGER_IMPORT="1"
+        )
+
+        assert "ai_dev_console.models.client.base" in modules
+
+    def test_cli_import_does_not_load_model_registry(self):
+        """
+        Story: A user runs ``ai-prompt --help``
+        Given the CLI module is imported
+        When no arguments have been parsed yet
+        Then the model registry should not be loaded
+        """
+        modules = _loaded_modules("import ai_dev_console_apps.cli.prompt.main")
+
+        assert "ai_dev_console.models" not in modules
+
+    def test_cli_vendor_choices_match_vendors(self):
+        """
+        Story: A new vendor is added to the Vendor enum
+        Given the CLI's inline vendor choices
+        When comparing them with the Vendor values
+        Then they should list exactly the same vendors
+        """
+        from ai_dev_console.models import VENDOR_BY_VALUE
+        from ai_dev_console_apps.cli.prompt.main import _VENDOR_CHOICES
+
+        assert list(_VENDOR_CHOICES) == list(VENDOR_BY_VALUE)
+
+
+class TestUniqueModuleCheck:
+    """
+    Test suite for the duplicate-module guard run in CI.
+    """
+
+    def _check(self, root):
+        return subprocess.run(
+            [sys.executable, str(CHECK_UNIQUE_INITS), str(root)],
+            capture_output=True,
+            text=True,
+        )
+
+    def test_source_tree_has_unique_modules(self):
+        """
+        Story: Only one definition of each module may ship in the wheel
+        Given the package sources
+        When running the duplicate-module check
+        Then it should pass
+        """
+        result = self._check(REPO_ROOT / "src")
+
+        assert result.returncode == 0, result.stderr
+
+    def test_shadowed_package_is_reported(self, tmp_path):
+        """
+        Story: A merge leaves both a module and a package with the same name
+        Given ``pkg/models.py`` next to a different ``pkg/models/__init__.py``
+        When running the duplicate-module check
+        Then it should fail and name the module
+        """
+        (tmp_path / "pkg" / "models").mkdir(parents=True)
+        (tmp_path / "pkg" / "models.py").write_text("SLIM = True\n")
+        (tmp_path / "pkg" / "models" / "__init__.py").write_text("FAT = True\n")
+
+        result = self._check(tmp_path)
+
+        assert result.returncode == 1
+        assert "pkg.models: defined by multiple files" in result.stderr
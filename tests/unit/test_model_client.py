@@ -1,20 +1,54 @@
+import asyncio
+import json
+import pickle
+import threading
+from dataclasses import asdict
 from typing import Any, Dict, List
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
+import anthropic
 import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from anthropic.types import Message as AnthropicMessage
+from anthropic.types import TextBlock, ThinkingBlock, Usage
 
 from ai_dev_console.models import (
     ContentBlock,
     ConverseRequest,
+    ConverseResponse,
     InferenceConfiguration,
     Message,
     ModelClient,
+    ModelClientError,
+    ModelRequestError,
+    ModelValidationError,
     ModelClientFactory,
     Role,
     Vendor,
 )
 from ai_dev_console.models.client.adapters import VendorAdapter
-from ai_dev_console.models.client.base import AWSClient
+from ai_dev_console.models.client import base
+from ai_dev_console.models.client.base import (
+    AnthropicClient,
+    AWSClient,
+    BatchingModelClient,
+)
+
+
+def _anthropic_message(*blocks: Any) -> AnthropicMessage:
+    """Build an SDK Message from text strings and ThinkingBlocks."""
+    return AnthropicMessage.model_construct(
+        id="msg_1",
+        type="message",
+        role="assistant",
+        model="claude-3-haiku-20240307",
+        content=[
+            TextBlock(type="text", text=b) if isinstance(b, str) else b for b in blocks
+        ],
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(input_tokens=3, output_tokens=5),
+    )
 
 
 class TestModelClientFactory:
@@ -22,13 +56,14 @@ class TestModelClientFactory:
     Test suite for model client creation scenarios.
     """
 
-    def test_creates_anthropic_client(self):
+    def test_creates_anthropic_client(self, monkeypatch):
         """
         Story: A developer wants to use Anthropic's models
         Given valid Anthropic credentials
         When creating a client for Anthropic
         Then they should get a properly configured client
         """
+        monkeypatch.setattr(base, "_ANTHROPIC_CLIENT", None)
         with patch("anthropic.Anthropic") as mock_anthropic:
             factory = ModelClientFactory()
             client = factory.create_client(Vendor.ANTHROPIC)
@@ -36,13 +71,30 @@ class TestModelClientFactory:
             assert isinstance(client, ModelClient)
             mock_anthropic.assert_called_once_with()
 
-    def test_creates_aws_client(self):
+    def test_anthropic_clients_share_one_sdk_client(self, monkeypatch):
+        """
+        Story: A service creates an Anthropic client per incoming request
+        Given the default Anthropic credentials
+        When creating several Anthropic clients
+        Then they should share one SDK client and its connection pool
+        """
+        monkeypatch.setattr(base, "_ANTHROPIC_CLIENT", None)
+        with patch("anthropic.Anthropic") as mock_anthropic:
+            factory = ModelClientFactory()
+            first = factory.create_client(Vendor.ANTHROPIC)
+            second = factory.create_client(Vendor.ANTHROPIC)
+
+        mock_anthropic.assert_called_once_with()
+        assert first.client is second.client
+
+    def test_creates_aws_client(self, monkeypatch):
         """
         Story: A developer wants to use AWS models
         Given valid AWS credentials
         When creating a client for AWS
         Then they should get a properly configured client
         """
+        monkeypatch.setattr(base, "_BEDROCK_CLIENTS", {})
         with patch("boto3.client") as mock_boto3:
             factory = ModelClientFactory()
             client = factory.create_client(
@@ -52,8 +104,75 @@ class TestModelClientFactory:
             assert isinstance(client, ModelClient)
             mock_boto3.assert_called_once_with(
                 "bedrock-runtime",
+                config=ANY,
             )
 
+    def test_aws_clients_share_one_bedrock_client(self, monkeypatch):
+        """
+        Story: A service creates an AWS client per incoming request
+        Given the default AWS credential chain
+        When creating several AWS clients
+        Then they should share one tuned bedrock-runtime client
+        """
+        monkeypatch.setattr(base, "_BEDROCK_CLIENTS", {})
+        with patch("boto3.client") as mock_boto3:
+            factory = ModelClientFactory()
+            first = factory.create_client(Vendor.AWS)
+            second = factory.create_client(Vendor.AWS)
+
+        mock_boto3.assert_called_once()
+        assert first.client is second.client
+        config = mock_boto3.call_args.kwargs["config"]
+        assert config.max_pool_connections == 50
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+
+    def test_new_default_session_gets_a_new_bedrock_client(self, monkeypatch):
+        """
+        Story: The GUI assumes an AWS role and replaces the default session
+        Given an AWS client created with the original credentials
+        When the default boto3 session is replaced and a client created again
+        Then a new bedrock-runtime client should use the new credentials
+        """
+        import boto3
+
+        monkeypatch.setattr(base, "_BEDROCK_CLIENTS", {})
+        monkeypatch.setattr(boto3, "DEFAULT_SESSION", Mock())
+        with patch("boto3.client") as mock_boto3:
+            factory = ModelClientFactory()
+            factory.create_client(Vendor.AWS)
+            monkeypatch.setattr(boto3, "DEFAULT_SESSION", Mock())
+            factory.create_client(Vendor.AWS)
+
+        assert mock_boto3.call_count == 2
+
+    def test_aws_pool_size_is_configurable(self, monkeypatch):
+        """
+        Story: A service calls Bedrock from 100 worker threads
+        Given a larger connection pool size
+        When creating an AWS client
+        Then the bedrock-runtime client should be built with that pool size
+        """
+        monkeypatch.setattr(base, "_BEDROCK_CLIENTS", {})
+        with patch("boto3.client") as mock_boto3:
+            ModelClientFactory().create_client(Vendor.AWS, max_pool_connections=100)
+
+        config = mock_boto3.call_args.kwargs["config"]
+        assert config.max_pool_connections == 100
+
+    def test_rejects_unknown_vendors(self):
+        """
+        Story: A developer passes something that is not a supported vendor
+        Given the client factory
+        When creating a client for an unknown or unimplemented vendor
+        Then a ValueError or NotImplementedError should be raised respectively
+        """
+        factory = ModelClientFactory()
+
+        with pytest.raises(ValueError, match="Unsupported vendor"):
+            factory.create_client("mistral")
+        with pytest.raises(NotImplementedError):
+            factory.create_client(Vendor.OPENAI)
+
     def test_crossregion_inference_profile_resolution(self):
         """
         Story: AWS Bedrock provides access to the model Claude Sonnet 3.7 only
@@ -147,3 +266,924 @@ class TestVendorAdapter:
             "messages": [{"role": "user", "content": [{"text": "Hello"}]}],
             "inferenceConfig": {"temperature": 0.7, "maxTokens": 1000},
         }
+
+    def test_adapter_instances_are_shared_per_vendor(self):
+        """
+        Story: Adapters are stateless and created for every client
+        Given the adapter factory
+        When requesting an adapter for the same vendor twice
+        Then the same instance should be returned
+        """
+        assert VendorAdapter.create(Vendor.AWS) is VendorAdapter.create(Vendor.AWS)
+        assert VendorAdapter.create(Vendor.ANTHROPIC) is not VendorAdapter.create(
+            Vendor.AWS
+        )
+
+    def test_adapter_for_unsupported_vendor(self):
+        """
+        Story: A developer asks for an adapter that does not exist yet
+        Given a vendor without an adapter
+        When creating the adapter
+        Then a ValueError should be raised
+        """
+        with pytest.raises(ValueError, match="Unsupported vendor"):
+            VendorAdapter.create(Vendor.OPENAI)
+
+    def test_aws_inference_config_field_mapping(self, aws_adapter):
+        """
+        Story: Every inference parameter must reach Bedrock under its own name
+        Given a request that sets all inference parameters
+        When converting for AWS
+        Then each one should be renamed to Bedrock's camelCase key
+        """
+        request = ConverseRequest(
+            model_id="anthropic.claude-3-haiku-20240307",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hello")])],
+            inference_config=InferenceConfiguration(
+                temperature=0.5, max_tokens=100, top_p=0.9, stop_sequences=["END"]
+            ),
+        )
+
+        adapted = aws_adapter.adapt_request(request)
+
+        assert adapted["inferenceConfig"] == {
+            "temperature": 0.5,
+            "maxTokens": 100,
+            "topP": 0.9,
+            "stopSequences": ["END"],
+        }
+
+    def test_aws_reasoning_config_only_for_claude_3_7(self, aws_adapter):
+        """
+        Story: Extended reasoning is only available on Claude 3.7 in Bedrock
+        Given requests with thinking enabled
+        When converting for AWS
+        Then only the Claude 3.7 request should carry a reasoning config
+        """
+
+        def adapt(model_id):
+            return aws_adapter.adapt_request(
+                ConverseRequest(
+                    model_id=model_id,
+                    messages=[
+                        Message(role=Role.USER, content=[ContentBlock(text="Hi")])
+                    ],
+                    thinking_enabled=True,
+                    thinking_budget=2000,
+                )
+            )
+
+        sonnet = adapt("anthropic.claude-3-7-sonnet-20250219-v1:0")
+        haiku = adapt("anthropic.claude-3-haiku-20240307-v1:0")
+
+        assert sonnet["additionalModelRequestFields"] == {
+            "reasoning_config": {"type": "enabled", "budget_tokens": 2000}
+        }
+        assert "additionalModelRequestFields" not in haiku
+
+    def test_anthropic_thinking_does_not_write_to_stdout(
+        self, anthropic_adapter, capsys
+    ):
+        """
+        Story: Adapting a request must not have side effects
+        Given a request with thinking enabled
+        When converting for Anthropic
+        Then the thinking block is added and nothing is printed
+        """
+        request = ConverseRequest(
+            model_id="claude-3-7-sonnet-20250219",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hi")])],
+            thinking_enabled=True,
+        )
+
+        adapted = anthropic_adapter.adapt_request(request)
+
+        assert adapted["thinking"] == {"type": "enabled", "budget_tokens": 16000}
+        assert capsys.readouterr().out == ""
+
+    def test_anthropic_multi_block_request_adaptation(self, anthropic_adapter):
+        """
+        Story: A developer sends an image together with a question
+        Given a message with an image block and a text block
+        When converting for Anthropic
+        Then both blocks should be sent as typed content blocks in order
+        """
+        image = {"media_type": "image/png", "data": "aGVsbG8="}
+        request = ConverseRequest(
+            model_id="claude-3-haiku-20240307",
+            messages=[
+                Message(
+                    role=Role.USER,
+                    content=[ContentBlock(image=image), ContentBlock(text="What?")],
+                )
+            ],
+        )
+
+        adapted = anthropic_adapter.adapt_request(request)
+
+        assert adapted["messages"] == [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "image/png",
+                            "data": "aGVsbG8=",
+                        },
+                    },
+                    {"type": "text", "text": "What?"},
+                ],
+            }
+        ]
+
+    def test_anthropic_response_blocks_ignore_extra_keys(self, anthropic_adapter):
+        """
+        Story: Anthropic returns typed content blocks with extra metadata
+        Given a response whose blocks carry keys ContentBlock does not define
+        When converting the response
+        Then the known fields should be kept and the rest ignored
+        """
+        response = {
+            "messages": [
+                {
+                    "role": "assistant",
+                    "content": [
+                        {"type": "text", "text": "Hello", "citations": None},
+                        {"type": "text", "text": "again"},
+                    ],
+                }
+            ]
+        }
+
+        adapted = anthropic_adapter.adapt_response(response)
+
+        assert adapted.messages[0].content == [
+            ContentBlock(text="Hello"),
+            ContentBlock(text="again"),
+        ]
+
+    @pytest.mark.parametrize("role", list(Role))
+    def test_response_roles_map_to_role_members(self, role):
+        """
+        Story: Responses may carry any of the wire-format role strings
+        Given an Anthropic and a Bedrock response with that role string
+        When converting the responses
+        Then the messages should carry the matching Role member
+        """
+        anthropic_response = {"messages": [{"role": role.value, "content": "Hi"}]}
+        aws_response = {
+            "output": {"message": {"role": role.value, "content": [{"text": "Hi"}]}}
+        }
+
+        anthropic = VendorAdapter.create(Vendor.ANTHROPIC)
+        aws = VendorAdapter.create(Vendor.AWS)
+
+        assert anthropic.adapt_response(anthropic_response).messages[0].role is role
+        assert aws.adapt_response(aws_response).messages[0].role is role
+
+    def test_anthropic_sdk_message_is_read_directly(self, anthropic_adapter):
+        """
+        Story: The Anthropic SDK returns a pydantic Message with thinking
+        Given an SDK Message with a thinking block and a text block
+        When converting the response
+        Then text, thinking, stop reason and usage should be carried over
+        """
+        thinking = ThinkingBlock(type="thinking", thinking="Hmm", signature="sig")
+
+        adapted = anthropic_adapter.adapt_response(
+            _anthropic_message(thinking, "Answer")
+        )
+
+        assert adapted.messages == [
+            Message(
+                role=Role.ASSISTANT,
+                content=[
+                    ContentBlock(thinking={"text": "Hmm", "signature": "sig"}),
+                    ContentBlock(text="Answer"),
+                ],
+            )
+        ]
+        assert adapted.thinking == {"text": "Hmm", "signature": "sig"}
+        assert adapted.stop_reason == "end_turn"
+        assert adapted.usage == {"input_tokens": 3, "output_tokens": 5}
+
+    def test_adapted_requests_are_independent(self, anthropic_adapter, aws_adapter):
+        """
+        Story: Callers may tweak an adapted request before sending it
+        Given two requests for the same model
+        When the first adapted request is modified, nested fields included
+        Then the second adapted request should be unaffected
+        """
+        request = ConverseRequest(
+            model_id="claude-3-haiku-20240307",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hello")])],
+            thinking_enabled=True,
+        )
+
+        first = anthropic_adapter.adapt_request(request)
+        first["model"] = "changed"
+        first["thinking"]["budget_tokens"] = 1
+        second = anthropic_adapter.adapt_request(request)
+
+        assert second["model"] == "claude-3-haiku-20240307"
+        assert second["thinking"]["budget_tokens"] == request.thinking_budget
+
+        request = ConverseRequest(
+            model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hello")])],
+            thinking_enabled=True,
+        )
+
+        first = aws_adapter.adapt_request(request)
+        first["additionalModelRequestFields"]["top_k"] = 5
+        first["additionalModelRequestFields"]["reasoning_config"]["type"] = "off"
+        second = aws_adapter.adapt_request(request)
+
+        assert second["additionalModelRequestFields"] == {
+            "reasoning_config": {
+                "type": "enabled",
+                "budget_tokens": request.thinking_budget,
+            }
+        }
+
+    def test_stop_sequences_are_copied(self, anthropic_adapter, aws_adapter):
+        """
+        Story: Callers may add stop sequences to an adapted request
+        Given an inference configuration with a list of stop sequences
+        When the adapted requests' stop sequences are extended
+        Then the caller's configuration should be unaffected
+        """
+        config = InferenceConfiguration(stop_sequences=["END"])
+        request = ConverseRequest(
+            model_id="anthropic.claude-3-haiku-20240307",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hello")])],
+            inference_config=config,
+        )
+
+        anthropic_adapter.adapt_request(request)["stop_sequences"].append("STOP")
+        aws_adapter.adapt_request(request)["inferenceConfig"]["stopSequences"].append(
+            "STOP"
+        )
+
+        assert config.stop_sequences == ["END"]
+
+    def test_aws_response_keeps_blocks_in_one_message(self, aws_adapter):
+        """
+        Story: Claude 3.7 on Bedrock returns reasoning followed by the answer
+        Given a Bedrock response with a reasoning block and a text block
+        When converting the response
+        Then both blocks should belong to a single assistant message
+        """
+        response = {
+            "output": {
+                "message": {
+                    "role": "assistant",
+                    "content": [
+                        {"reasoningContent": {"reasoningText": {"text": "Hmm"}}},
+                        {"text": "Answer"},
+                    ],
+                }
+            },
+            "stopReason": "end_turn",
+        }
+
+        adapted = aws_adapter.adapt_response(response)
+
+        assert len(adapted.messages) == 1
+        assert adapted.messages[0].role == Role.ASSISTANT
+        assert [block.thinking for block in adapted.messages[0].content] == [
+            {"text": "Hmm"},
+            None,
+        ]
+        assert adapted.messages[0].content[1].text == "Answer"
+        assert adapted.stop_reason == "end_turn"
+
+
+class TestAWSClient:
+    """
+    Test suite for the AWS Bedrock client.
+    """
+
+    @pytest.fixture
+    def bedrock_client(self):
+        """Provides a mock bedrock-runtime client with fixed region and account."""
+        mock_client = Mock()
+        mock_client.meta.region_name = "eu-central-1"
+        credentials = mock_client._session.get_credentials.return_value
+        credentials.get_frozen_credentials.return_value.account_id = "123456789"
+        mock_client.converse.return_value = {
+            "output": {"message": {"role": "assistant", "content": [{"text": "Hi"}]}},
+            "stopReason": "end_turn",
+        }
+        return mock_client
+
+    def test_account_id_is_looked_up_lazily(self, bedrock_client):
+        """
+        Story: Most Bedrock models do not need the AWS account ID
+        Given a newly created AWS client
+        When no inference profile has been resolved
+        Then the account ID should not have been looked up yet
+        """
+        with patch(
+            "ai_dev_console.models.client.base.get_aws_account_id",
+            return_value="123456789",
+        ) as mock_lookup:
+            client = AWSClient(bedrock_client)
+            client._resolve_model_id("anthropic.claude-3-haiku-20240307-v1:0")
+            mock_lookup.assert_not_called()
+
+            assert client.account_id == "123456789"
+            assert client.account_id == "123456789"
+            mock_lookup.assert_called_once_with(bedrock_client)
+
+    def test_converse_async_runs_requests_concurrently(self, bedrock_client):
+        """
+        Story: An async app sends several Bedrock requests at once
+        Given a Bedrock client whose calls block until all have started
+        When conversing asynchronously with every request in flight
+        Then each call should complete off the event loop
+        """
+        started = threading.Barrier(3, timeout=5)
+
+        def converse(**kwargs):
+            started.wait()
+            return {
+                "output": {
+                    "message": {"role": "assistant", "content": [{"text": "Hi"}]}
+                },
+                "stopReason": "end_turn",
+            }
+
+        bedrock_client.converse.side_effect = converse
+        client = AWSClient(bedrock_client)
+        request = ConverseRequest(
+            model_id="claude-3-haiku-20240307",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hello")])],
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *(client.converse_async(request) for _ in range(3))
+            )
+
+        responses = asyncio.run(run())
+
+        assert [r.messages[0].content[0].text for r in responses] == ["Hi"] * 3
+
+    @pytest.fixture
+    def stream_request(self):
+        """Provides a request for a model that needs no inference profile."""
+        return ConverseRequest(
+            model_id="claude-3-haiku-20240307",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hello")])],
+        )
+
+    def test_converse_stream_yields_text_and_thinking(
+        self, bedrock_client, stream_request
+    ):
+        """
+        Story: A user watches a Bedrock answer stream in
+        Given a Bedrock event stream with text deltas and reasoning content
+        When consuming the AWS client stream
+        Then the text chunks should be yielded and the full response stored
+        """
+        bedrock_client.converse_stream.return_value = {
+            "stream": [
+                {"messageStart": {"role": "assistant"}},
+                {"contentBlockDelta": {"delta": {"text": "Hel"}}},
+                {"contentBlockDelta": {"delta": {"text": ""}}},
+                {"contentBlockDelta": {"delta": {"reasoningContent": {"text": "H"}}}},
+                {"contentBlockDelta": {"delta": {"text": "lo"}}},
+                {"contentBlockDelta": {"delta": {"reasoningContent": {"text": "m"}}}},
+                {"messageStop": {"stopReason": "end_turn"}},
+            ]
+        }
+        client = AWSClient(bedrock_client)
+
+        with client.converse_stream(stream_request) as stream:
+            chunks = list(stream)
+
+        assert chunks == ["Hel", "lo"]
+        assert client.response == {"text": "Hello", "thinking": {"text": "Hm"}}
+
+    def test_converse_stream_raises_on_error_event(
+        self, bedrock_client, stream_request
+    ):
+        """
+        Story: Bedrock throttles a request in the middle of a stream
+        Given a Bedrock event stream containing a throttling exception event
+        When consuming the AWS client stream
+        Then a ModelClientError with the Bedrock message should be raised
+        """
+        bedrock_client.converse_stream.return_value = {
+            "stream": [
+                {"messageStart": {"role": "assistant"}},
+                {"contentBlockDelta": {"delta": {"text": "Hi"}}},
+                {"throttlingException": {"message": "Slow down"}},
+            ]
+        }
+        client = AWSClient(bedrock_client)
+
+        with client.converse_stream(stream_request) as stream:
+            with pytest.raises(ModelClientError, match="AWS Bedrock error: Slow down"):
+                list(stream)
+
+    def test_converse_stream_raises_error_before_message_start(
+        self, bedrock_client, stream_request
+    ):
+        """
+        Story: Bedrock rejects a request before any output is produced
+        Given a Bedrock event stream that starts with an exception event
+        When consuming the AWS client stream
+        Then the error should be raised instead of an empty response
+        """
+        bedrock_client.converse_stream.return_value = {
+            "stream": [{"serviceUnavailableException": {"message": "Try later"}}]
+        }
+        client = AWSClient(bedrock_client)
+
+        with client.converse_stream(stream_request) as stream:
+            with pytest.raises(ModelClientError, match="Try later"):
+                list(stream)
+
+    def test_converse_stream_blocks_yields_text_and_reasoning(
+        self, bedrock_client, stream_request
+    ):
+        """
+        Story: A UI shows Claude's reasoning live while it is generated
+        Given a Bedrock event stream with reasoning deltas then text deltas
+        When consuming the block stream and the text stream
+        Then blocks should arrive in order and the text stream keep the thinking
+        """
+        events = [
+            {"messageStart": {"role": "assistant"}},
+            {"contentBlockDelta": {"delta": {"reasoningContent": {"text": "Let "}}}},
+            {"contentBlockDelta": {"delta": {"reasoningContent": {"text": "me"}}}},
+            {"contentBlockStop": {"contentBlockIndex": 0}},
+            {"contentBlockDelta": {"delta": {"text": "Hi"}}},
+            {"messageStop": {"stopReason": "end_turn"}},
+        ]
+        bedrock_client.converse_stream.return_value = {"stream": events}
+        client = AWSClient(bedrock_client)
+
+        with client.converse_stream_blocks(stream_request) as stream:
+            blocks = list(stream)
+        with client.converse_stream(stream_request) as stream:
+            chunks = list(stream)
+
+        assert blocks == [
+            ContentBlock(thinking={"text": "Let "}),
+            ContentBlock(thinking={"text": "me"}),
+            ContentBlock(text="Hi"),
+        ]
+        assert chunks == ["Hi"]
+        assert client.response == {"text": "Hi", "thinking": {"text": "Let me"}}
+
+    @pytest.mark.parametrize(
+        "error, retryable, status_code",
+        [
+            (
+                ClientError(
+                    {
+                        "Error": {"Code": "ThrottlingException", "Message": "Slow"},
+                        "ResponseMetadata": {"HTTPStatusCode": 429},
+                    },
+                    "Converse",
+                ),
+                True,
+                429,
+            ),
+            (
+                ClientError(
+                    {
+                        "Error": {"Code": "ValidationException", "Message": "Bad"},
+                        "ResponseMetadata": {"HTTPStatusCode": 400},
+                    },
+                    "Converse",
+                ),
+                False,
+                400,
+            ),
+            (EndpointConnectionError(endpoint_url="https://bedrock"), True, None),
+        ],
+    )
+    def test_converse_errors_carry_retry_hints(
+        self, bedrock_client, stream_request, error, retryable, status_code
+    ):
+        """
+        Story: A retry loop must tell throttling apart from a bad request
+        Given Bedrock failing with a throttling, validation or network error
+        When conversing through the AWS client
+        Then a ModelRequestError should say whether a retry may succeed
+        """
+        bedrock_client.converse.side_effect = error
+        client = AWSClient(bedrock_client)
+
+        with pytest.raises(ModelRequestError) as exc_info:
+            client.converse(stream_request)
+
+        assert exc_info.value.retryable is retryable
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.__cause__ is error
+
+    def test_invalid_request_raises_validation_error(self, bedrock_client):
+        """
+        Story: A caller sends a request without messages
+        Given an invalid request
+        When conversing through the AWS client
+        Then a ModelValidationError, also a ValueError, should be raised unwrapped
+        """
+        request = ConverseRequest(model_id="claude-3-haiku-20240307", messages=[])
+
+        with pytest.raises(ModelValidationError, match="^At least one message"):
+            AWSClient(bedrock_client).converse(request)
+        with pytest.raises(ValueError):
+            AWSClient(bedrock_client).converse(request)
+        bedrock_client.converse.assert_not_called()
+
+    def test_streaming_state_is_declared_up_front(self, bedrock_client):
+        """
+        Story: The GUI inspects a client's last response after streaming
+        Given a freshly created AWS client
+        When no stream has been consumed yet
+        Then the streaming attributes should exist, be empty and use slots
+        """
+        client = AWSClient(bedrock_client)
+
+        assert client.response is None
+        assert client._raw_response is None
+        assert client._generator is None
+        assert not hasattr(client, "__dict__")
+
+    def test_sts_account_id_lookup_is_cached(self, monkeypatch):
+        """
+        Story: Credentials do not expose the account, so STS must be asked
+        Given a Bedrock client without account information in its session
+        When looking up the account ID several times
+        Then only one STS client and one GetCallerIdentity call should be made
+        """
+        monkeypatch.setattr(base, "_STS_CLIENT", None)
+        monkeypatch.setattr(base, "_ACCOUNT_ID_CACHE", {})
+        bedrock_client = Mock(spec=[])
+
+        with patch("boto3.client") as mock_boto3:
+            mock_boto3.return_value.get_caller_identity.return_value = {
+                "Account": "123456789"
+            }
+            first = base.get_aws_account_id(bedrock_client)
+            second = base.get_aws_account_id(bedrock_client)
+
+        assert first == second == "123456789"
+        mock_boto3.assert_called_once_with("sts")
+        mock_boto3.return_value.get_caller_identity.assert_called_once_with()
+
+
+class TestAnthropicClient:
+    """
+    Test suite for the Anthropic client.
+    """
+
+    @pytest.fixture
+    def test_request(self):
+        """Provides a test request."""
+        return ConverseRequest(
+            model_id="claude-3-haiku-20240307",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text="Hello")])],
+        )
+
+    def test_rate_limit_is_retryable(self, test_request):
+        """
+        Story: Anthropic rate-limits a burst of requests
+        Given the SDK raising a RateLimitError
+        When conversing through the Anthropic client
+        Then a retryable ModelRequestError with status 429 should be raised
+        """
+        sdk_client = Mock()
+        sdk_client.messages.create.side_effect = anthropic.RateLimitError(
+            "Slow down", response=Mock(status_code=429), body=None
+        )
+
+        with pytest.raises(ModelRequestError) as exc_info:
+            AnthropicClient(sdk_client).converse(test_request)
+
+        assert exc_info.value.retryable
+        assert exc_info.value.status_code == 429
+
+    def test_async_client_is_reused_and_closed(self, test_request):
+        """
+        Story: An async service sends many requests through one client
+        Given an Anthropic client used for several async calls
+        When the calls complete and the client is closed
+        Then a single AsyncAnthropic with the same settings should be created,
+        reused and closed
+        """
+        response = _anthropic_message("Hi")
+
+        with patch("anthropic.AsyncAnthropic") as mock_async_anthropic:
+            async_client = mock_async_anthropic.return_value
+            async_client.messages.create = AsyncMock(return_value=response)
+            async_client.close = AsyncMock()
+            sdk_client = Mock(
+                api_key="sk-test",
+                auth_token=None,
+                base_url="https://example.test",
+                timeout=30.0,
+                max_retries=5,
+                _custom_headers={"X-Team": "console"},
+                _custom_query={},
+            )
+            client = AnthropicClient(sdk_client)
+
+            async def run():
+                first = await client.converse_async(test_request)
+                await client.converse_async(test_request)
+                await client.aclose()
+                return first
+
+            first = asyncio.run(run())
+
+        mock_async_anthropic.assert_called_once_with(
+            api_key="sk-test",
+            auth_token=None,
+            base_url="https://example.test",
+            timeout=30.0,
+            max_retries=5,
+            default_headers={"X-Team": "console"},
+            default_query={},
+        )
+        assert async_client.messages.create.await_count == 2
+        async_client.close.assert_awaited_once()
+        assert first.messages[0].content[0].text == "Hi"
+
+
+class TestBatchingModelClient:
+    """
+    Test suite for coalescing concurrent async requests.
+    """
+
+    def _request(self, text):
+        return ConverseRequest(
+            model_id="claude-3-haiku-20240307",
+            messages=[Message(role=Role.USER, content=[ContentBlock(text=text)])],
+        )
+
+    def _converse_all(self, client, texts):
+        async def run():
+            try:
+                return await asyncio.gather(
+                    *(client.converse_async(self._request(text)) for text in texts)
+                )
+            finally:
+                await client.aclose()
+
+        return asyncio.run(run())
+
+    def test_anthropic_requests_share_one_message_batch(self):
+        """
+        Story: An offline bulk job fires many prompts at once
+        Given a client opted in to Message Batches and two concurrent requests
+        When both are awaited
+        Then one Message Batch should be submitted and each caller get its answer
+        """
+        sdk_client = Mock()
+        batches = sdk_client.messages.batches
+
+        def entry(custom_id, text):
+            result = Mock(type="succeeded", message=_anthropic_message(text))
+            return Mock(custom_id=custom_id, result=result)
+
+        # Results may come back in any order
+        batches.results.return_value = [
+            entry("request-1", "Second"),
+            entry("request-0", "First"),
+        ]
+        batches.retrieve.return_value = Mock(id="batch-1", processing_status="ended")
+        batches.create.return_value = Mock(
+            id="batch-1", processing_status="in_progress"
+        )
+        client = ModelClientFactory().create_client(
+            Vendor.ANTHROPIC, client=sdk_client, batch=True
+        )
+        assert isinstance(client, BatchingModelClient)
+        client.poll_interval = 0
+
+        first, second = self._converse_all(client, ["One", "Two"])
+
+        batches.create.assert_called_once()
+        assert len(batches.create.call_args.kwargs["requests"]) == 2
+        batches.retrieve.assert_called_once_with("batch-1")
+        batches.results.assert_called_once_with("batch-1")
+        assert first.messages[0].content[0].text == "First"
+        assert second.messages[0].content[0].text == "Second"
+
+    def test_failed_batch_entries_raise(self):
+        """
+        Story: One prompt in a batch is rejected by the API
+        Given a Message Batch whose second entry errored
+        When both requests are awaited
+        Then the first should succeed and the second raise ModelClientError
+        """
+        sdk_client = Mock()
+        batches = sdk_client.messages.batches
+        batches.create.return_value = Mock(id="batch-1", processing_status="ended")
+        ok = Mock(
+            custom_id="request-0",
+            result=Mock(type="succeeded", message=_anthropic_message("Fine")),
+        )
+        batches.results.return_value = [
+            ok,
+            Mock(custom_id="request-1", result=Mock(type="errored")),
+        ]
+        client = BatchingModelClient(AnthropicClient(sdk_client))
+
+        async def run():
+            try:
+                return await asyncio.gather(
+                    client.converse_async(self._request("One")),
+                    client.converse_async(self._request("Two")),
+                    return_exceptions=True,
+                )
+            finally:
+                await client.aclose()
+
+        first, second = asyncio.run(run())
+
+        assert first.messages[0].content[0].text == "Fine"
+        assert isinstance(second, ModelClientError)
+
+    def test_message_batches_need_an_anthropic_client(self):
+        """
+        Story: Bedrock has no Message Batches API
+        Given an AWS client
+        When wrapping it in a batching client
+        Then a ValueError should be raised
+        """
+        with pytest.raises(ValueError, match="AnthropicClient"):
+            BatchingModelClient(AWSClient(Mock()))
+        with pytest.raises(ValueError, match="AnthropicClient"):
+            ModelClientFactory().create_client(Vendor.AWS, client=Mock(), batch=True)
+
+    def test_aclose_cancels_batches_in_flight(self):
+        """
+        Story: An offline job is shut down while a batch is still processing
+        Given a submitted Message Batch that has not ended
+        When the client is closed
+        Then the polling task should stop and the waiting caller be cancelled
+        """
+        sdk_client = Mock()
+        batches = sdk_client.messages.batches
+        batches.create.return_value = Mock(
+            id="batch-1", processing_status="in_progress"
+        )
+        client = BatchingModelClient(AnthropicClient(sdk_client), poll_interval=3600)
+
+        async def run():
+            pending = asyncio.ensure_future(client.converse_async(self._request("One")))
+            while not batches.create.called:
+                await asyncio.sleep(0.01)
+            await client.aclose()
+            assert not client._tasks
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+
+        asyncio.run(run())
+
+    def test_failed_batch_gives_each_caller_its_own_error(self):
+        """
+        Story: The Message Batches API is unreachable
+        Given a batch submission that raises
+        When two concurrent requests are awaited
+        Then each caller should get a distinct ModelClientError
+        """
+        sdk_client = Mock()
+        sdk_client.messages.batches.create.side_effect = RuntimeError("down")
+        client = BatchingModelClient(AnthropicClient(sdk_client))
+
+        async def run():
+            try:
+                return await asyncio.gather(
+                    client.converse_async(self._request("One")),
+                    client.converse_async(self._request("Two")),
+                    return_exceptions=True,
+                )
+            finally:
+                await client.aclose()
+
+        first, second = asyncio.run(run())
+
+        assert isinstance(first, ModelClientError)
+        assert isinstance(second, ModelClientError)
+        assert first is not second
+
+
+class TestClientTypes:
+    """
+    Test suite for the request/response data classes.
+    """
+
+    def test_slotted_types_round_trip(self):
+        """
+        Story: A service caches responses and logs them as JSON
+        Given a response built from the slotted data classes
+        When pickling it and converting it to a dict
+        Then it should round-trip unchanged and carry no per-instance dict
+        """
+        response = ConverseResponse(
+            messages=[Message(role=Role.ASSISTANT, content=[ContentBlock(text="Hi")])],
+            usage={"input_tokens": 1, "output_tokens": 2},
+            thinking={"thinking": "Hm"},
+        )
+
+        assert pickle.loads(pickle.dumps(response)) == response
+        assert asdict(response)["messages"][0]["content"][0]["text"] == "Hi"
+        assert not hasattr(response.messages[0].content[0], "__dict__")
+
+    def test_estimate_tokens_matches_joined_text_length(self):
+        """
+        Story: The GUI shows a token estimate for a long chat history
+        Given messages with several, empty and text-less content blocks
+        When estimating tokens
+        Then each message should count as its space-joined text, min 1 token
+        """
+        messages = [
+            Message(role=Role.USER, content=[ContentBlock(text="a" * 13)]),
+            Message(
+                role=Role.ASSISTANT,
+                content=[
+                    ContentBlock(text="b" * 11),
+                    ContentBlock(image={"data": ""}),
+                    ContentBlock(text="c" * 12),
+                ],
+            ),
+            Message(role=Role.USER, content=[]),
+        ]
+        request = ConverseRequest(
+            model_id="claude-3-haiku-20240307", messages=messages, system="s" * 30
+        )
+
+        # 13 // 6 = 2; (11 + 2 spaces + 12) // 6 = 4; empty -> 1; system 30 // 6
+        assert request.estimate_tokens() == 2 + 4 + 1 + 5
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"temperature": -0.1}, "Temperature must be between 0 and 1"),
+            ({"temperature": 1.5}, "Temperature must be between 0 and 1"),
+            ({"top_p": 2}, "Top P must be between 0 and 1"),
+            ({"max_tokens": 0}, "Max tokens must be positive"),
+            ({"max_tokens": 64001}, "Max tokens cannot exceed 64000"),
+            ({"stop_sequences": "END"}, "Stop sequences must be a list of strings"),
+            ({"stop_sequences": ("END",)}, "Stop sequences must be a list of strings"),
+            ({"stop_sequences": ["END", 1]}, "All stop sequences must be strings"),
+        ],
+    )
+    def test_inference_configuration_rejects_out_of_range_values(self, kwargs, message):
+        """
+        Story: A developer passes an invalid inference setting
+        Given an inference configuration with one bad value
+        When it is validated
+        Then a ValueError naming the problem should be raised
+        """
+        with pytest.raises(ValueError, match=message):
+            InferenceConfiguration(**kwargs).validate()
+
+    def test_inference_configuration_accepts_bounds(self):
+        """
+        Story: A developer uses the extreme allowed settings
+        Given an inference configuration at the edges of every range
+        When it is validated
+        Then no error should be raised
+        """
+        InferenceConfiguration(
+            temperature=1, top_p=0, max_tokens=64000, stop_sequences=[]
+        ).validate()
+
+    def test_roles_behave_as_strings(self):
+        """
+        Story: A developer compares or serializes roles without unwrapping them
+        Given the Role members
+        When comparing them to strings and encoding them as JSON
+        Then they should behave as their wire-format values
+        """
+        assert Role.USER == "user"
+        assert {"assistant": 1}[Role.ASSISTANT] == 1
+        assert json.dumps({"role": Role.SYSTEM}) == '{"role": "system"}'
+
+    def test_response_from_dict_parses_roles(self):
+        """
+        Story: A cached response is loaded back from its dict form
+        Given response dicts with a known and an unknown role
+        When building responses from them
+        Then the known role should map to Role and the unknown raise ValueError
+        """
+        response = ConverseResponse.from_dict(
+            {"messages": [{"role": "assistant", "content": [{"text": "Hi"}]}]}
+        )
+
+        assert response.messages[0].role is Role.ASSISTANT
+        with pytest.raises(ValueError):
+            ConverseResponse.from_dict(
+                {"messages": [{"role": "robot", "content": [{"text": "Hi"}]}]}
+            )
@@ -4,7 +4,7 @@ from decimal import Decimal
 import pytest
 
 from ai_dev_console.models.model import AIModel, ModelCosts, SupportedModels
-from ai_dev_console.models.vendor import Vendor
+from ai_dev_console.models.vendor import VENDOR_BY_VALUE, Vendor
 
 
 class TestAIDeveloperWorkflow:
@@ -41,6 +41,19 @@ class TestAIDeveloperWorkflow:
         }
         assert set(supported_models.available_models) == expected_models
 
+    def test_available_models_keep_their_listing_order(self, supported_models):
+        """
+        Story: Callers pick the first available model as their default
+        Given the system is initialized
+        When the developer iterates over the available models
+        Then the newest model should come first, then Sonnet, then Haiku
+        """
+        assert list(supported_models.available_models) == [
+            "claude-3-7-sonnet-20250219",
+            "claude-3-5-sonnet-20241022",
+            "claude-3-haiku-20240307",
+        ]
+
     def test_developer_selects_cost_efficient_model(self):
         """
         Story: A developer wants to choose a cost-efficient model for their project
@@ -96,6 +109,79 @@ class TestCostEstimationScenarios:
         assert cost == Decimal("1.50000")
         assert len(str(cost).split(".")[1]) == 5  # Ensures 5 decimal precision
 
+    @pytest.mark.parametrize(
+        "tokens, expected", [(1, "0.00000"), (3, "0.00002"), (7, "0.00004")]
+    )
+    def test_developer_sees_costs_rounded_half_to_even(self, tokens, expected):
+        """
+        Story: A developer totals many tiny requests
+        Given costs that fall exactly halfway between two 5-decimal amounts
+        When they calculate the cost
+        Then it should round half to even, like Decimal.quantize
+        """
+        costs = ModelCosts(
+            input_cost_per_million_tokens=Decimal("5"),
+            output_cost_per_million_tokens=Decimal("0.075"),
+        )
+
+        cost = costs.calculate_cost(input_tokens=tokens, output_tokens=0)
+
+        assert str(cost) == expected
+
+    def test_repeated_cost_lookups_are_cached(self, project_costs):
+        """
+        Story: An accounting job prices many requests of the same size
+        Given two equal cost structures
+        When the same token counts are priced with each
+        Then the second calculation should be served from the cache
+        """
+        from ai_dev_console.models import model
+
+        model._cost.cache_clear()
+        same_costs = ModelCosts(
+            input_cost_per_million_tokens=Decimal("0.25"),
+            output_cost_per_million_tokens=Decimal("1.25"),
+        )
+
+        first = project_costs.calculate_cost(input_tokens=123, output_tokens=456)
+        second = same_costs.calculate_cost(input_tokens=123, output_tokens=456)
+
+        assert first == second == Decimal("0.00060")
+        assert model._cost.cache_info().hits == 1
+
+    def test_finely_priced_costs_are_exact(self):
+        """
+        Story: A vendor prices a model to many decimal places
+        Given costs with more decimal places than the result keeps
+        When they calculate the cost of a large job
+        Then no precision should be lost before the final rounding
+        """
+        costs = ModelCosts(
+            input_cost_per_million_tokens=Decimal("0.123456789"),
+            output_cost_per_million_tokens=Decimal("1.000000001"),
+        )
+
+        cost = costs.calculate_cost(input_tokens=7_654_321, output_tokens=999_999)
+
+        expected = (
+            Decimal(7_654_321) * Decimal("0.123456789")
+            + Decimal(999_999) * Decimal("1.000000001")
+        ) / Decimal(1_000_000)
+        assert cost == expected.quantize(Decimal("0.00001"))
+
+    def test_infinite_costs_are_rejected(self):
+        """
+        Story: A pricing table is loaded with a bad entry
+        Given an infinite input cost
+        When the costs are created
+        Then they should be rejected with a clear error message
+        """
+        with pytest.raises(ValueError, match="Costs must be finite"):
+            ModelCosts(
+                input_cost_per_million_tokens=Decimal("Infinity"),
+                output_cost_per_million_tokens=Decimal("1"),
+            )
+
     def test_developer_attempts_invalid_cost_calculation(self, project_costs):
         """
         Story: A developer accidentally inputs negative token counts
@@ -175,3 +261,211 @@ class TestModelSelectionScenarios:
 
         assert aws_model.vendor == Vendor.AWS
         assert anthropic_model.vendor == Vendor.ANTHROPIC
+
+    def test_registry_is_shared_and_read_only(self):
+        """
+        Story: Every client and page builds its own SupportedModels
+        Given two SupportedModels instances
+        When inspecting their registries
+        Then they should share one registry that cannot be modified
+        """
+        first, second = SupportedModels(), SupportedModels()
+
+        assert first is second
+        assert first.available_models is second.available_models
+        assert first._model_mappings is second._model_mappings
+        with pytest.raises(TypeError):
+            first.available_models["new-model"] = AIModel.claude_3_haiku()
+
+    def test_vendor_model_id_errors_name_the_problem(self):
+        """
+        Story: A developer asks for a model a vendor does not serve
+        Given a known model without an OpenAI ID, and an unknown model
+        When looking up their vendor-specific IDs
+        Then the errors should tell the two cases apart
+        """
+        models = SupportedModels()
+
+        assert (
+            models.get_vendor_model_id("claude-3-5-sonnet-20241022", Vendor.AWS)
+            == "anthropic.claude-3-5-sonnet-20240620-v1:0"
+        )
+        with pytest.raises(ValueError, match="not supported for vendor openai"):
+            models.get_vendor_model_id("claude-3-haiku-20240307", Vendor.OPENAI)
+        with pytest.raises(ValueError, match="No mapping found for model 'gpt-x'"):
+            models.get_vendor_model_id("gpt-x", Vendor.OPENAI)
+
+    def test_registry_entries_have_no_instance_dict(self):
+        """
+        Story: The registry grows to many models and vendors
+        Given a model, its costs and a model mapping from the registry
+        When inspecting the instances
+        Then they should use slots instead of a per-instance __dict__
+        """
+        models = SupportedModels()
+        model = models.get_model("claude-3-haiku-20240307")
+        mapping = models._model_mappings["claude-3-haiku-20240307"]
+
+        for instance in (model, model.costs, mapping):
+            assert not hasattr(instance, "__dict__")
+
+    def test_haiku_output_limit_comes_from_the_registry(self):
+        """
+        Story: Only one definition of each model may be live
+        Given the registered Claude 3 Haiku model
+        When checking its output token limit
+        Then it should be the registry's 8192, not a stale shadowed value
+        """
+        model = SupportedModels().get_model("claude-3-haiku-20240307")
+
+        assert model.max_output_tokens == 8192
+
+    def test_vendors_hash_by_identity(self):
+        """
+        Story: Registry lookups hash a vendor on every call
+        Given a vendor parsed from its value
+        When using it as a dictionary key
+        Then it should find entries keyed by the same member
+        """
+        vendor = Vendor("aws")
+
+        assert vendor is Vendor.AWS
+        assert hash(vendor) == object.__hash__(Vendor.AWS)
+        assert {("claude", Vendor.AWS): "id"}[("claude", vendor)] == "id"
+
+    def test_vendor_values_parse_to_members(self):
+        """
+        Story: The CLI parses the --vendor choice
+        Given every vendor value
+        When looking it up in the value table
+        Then it should give the same member as Vendor(value)
+        """
+        assert list(VENDOR_BY_VALUE) == ["anthropic", "aws", "openai"]
+        for value, vendor in VENDOR_BY_VALUE.items():
+            assert vendor is Vendor(value)
+
+    def test_probing_vendor_model_ids_without_exceptions(self):
+        """
+        Story: A developer lists which models a vendor serves
+        Given a served model and one the vendor does not serve
+        When probing their vendor-specific IDs
+        Then the missing one should come back as None instead of raising
+        """
+        models = SupportedModels()
+
+        assert (
+            models.try_get_vendor_model_id("claude-3-haiku-20240307", Vendor.AWS)
+            == "anthropic.claude-3-haiku-20240307-v1:0"
+        )
+        assert (
+            models.try_get_vendor_model_id("claude-3-haiku-20240307", Vendor.OPENAI)
+            is None
+        )
+
+    def test_vendor_ids_resolve_only_for_their_own_vendor(self):
+        """
+        Story: A developer switches vendors but keeps a Bedrock model ID
+        Given a Bedrock-specific model ID
+        When resolving it for Bedrock and then for Anthropic
+        Then it should resolve to itself for Bedrock and fail for Anthropic
+        """
+        models = SupportedModels()
+        aws_id = "anthropic.claude-3-7-sonnet-20250219-v1:0"
+
+        assert models.resolve_model_id(aws_id, Vendor.AWS) == aws_id
+        with pytest.raises(ValueError, match="No mapping found"):
+            models.resolve_model_id(aws_id, Vendor.ANTHROPIC)
+
+    def test_models_with_the_same_prices_share_costs(self):
+        """
+        Story: Several registry entries are sold at the same price
+        Given Claude 3.5 Sonnet on both vendors
+        When comparing their cost structures
+        Then they should be one shared, already parsed instance
+        """
+        models = SupportedModels()
+
+        aws = models.get_model("claude-3-5-sonnet-20241022", Vendor.AWS)
+        anthropic = models.get_model("claude-3-5-sonnet-20241022", Vendor.ANTHROPIC)
+
+        assert aws.costs is anthropic.costs
+        assert AIModel.claude_3_haiku().costs is AIModel.claude_3_haiku().costs
+
+    def test_lookup_tables_agree_with_registry_entries(self):
+        """
+        Story: Every model is declared once and the lookups derive from it
+        Given each model registered for each vendor
+        When looking up its vendor-specific ID and the model itself
+        Then both should match the declared registry entry
+        """
+        models = SupportedModels()
+
+        for name, by_vendor in models._models_by_vendor.items():
+            for vendor, model in by_vendor.items():
+                assert models.get_model(name, vendor) is model
+                assert models.get_vendor_model_id(name, vendor) == (
+                    model.vendor_model_id
+                )
+
+    def test_developer_lists_vision_models(self):
+        """
+        Story: A developer needs a model that can read screenshots
+        Given the supported models
+        When listing the models that accept images
+        Then only the Sonnet models should be listed
+        """
+        assert SupportedModels().models_with_vision() == [
+            "claude-3-7-sonnet-20250219",
+            "claude-3-5-sonnet-20241022",
+        ]
+
+    def test_developer_identifies_a_vendor_model_id(self):
+        """
+        Story: A developer finds a model ID in a Bedrock log line
+        Given a canonical name, a Bedrock model ID and an unknown ID
+        When resolving each to its canonical name and vendor
+        Then the Bedrock ID should name its vendor and the unknown one fail
+        """
+        models = SupportedModels()
+
+        assert models.resolve_model_name_and_vendor("claude-3-haiku-20240307") == (
+            "claude-3-haiku-20240307",
+            None,
+        )
+        assert models.resolve_model_name_and_vendor(
+            "anthropic.claude-3-5-sonnet-20240620-v1:0"
+        ) == ("claude-3-5-sonnet-20241022", Vendor.AWS)
+        with pytest.raises(ValueError, match="Unable to resolve model ID"):
+            models.resolve_model_name_and_vendor("gpt-x")
+
+    def test_get_model_defaults_to_the_anthropic_entry(self):
+        """
+        Story: A developer asks for a model without naming a vendor
+        Given a model offered by both Anthropic and AWS
+        When getting it without a vendor
+        Then the Anthropic entry listed in available_models should be returned
+        """
+        models = SupportedModels()
+
+        model = models.get_model("claude-3-7-sonnet-20250219")
+
+        assert model.vendor == Vendor.ANTHROPIC
+        assert model is models.available_models["claude-3-7-sonnet-20250219"]
+
+    def test_developer_lists_models_per_vendor(self):
+        """
+        Story: The GUI lists the models of the selected vendor
+        Given the supported models
+        When listing the models each vendor serves
+        Then every Claude model should be listed for Anthropic and AWS only
+        """
+        models = SupportedModels()
+        claude_models = [
+            "claude-3-7-sonnet-20250219",
+            "claude-3-5-sonnet-20241022",
+            "claude-3-haiku-20240307",
+        ]
+
+        assert models.models_for_vendor(Vendor.ANTHROPIC) == claude_models
+        assert models.models_for_vendor(Vendor.AWS) == claude_models
+        assert models.models_for_vendor(Vendor.OPENAI) == []
@@ -0,0 +1,58 @@
+"""Fail if a module under ``src/`` is defined more than once.
+
+Catches the leftovers that a bad merge or packaging trick can leave behind:
+
+- two files that import as the same dotted module (``foo.py`` next to
+  ``foo/__init__.py``, or names that only differ in case),
+- unresolved merge-conflict markers in a Python source file.
+
+Usage: ``python tools/check_unique_inits.py [SRC_DIR]``
+"""
+
+import hashlib
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+CONFLICT_MARKERS = ("<<<<<<< ", ">>>>>>> ")
+
+
+def module_name(path: Path, root: Path) -> str:
+    """Dotted, case-folded import name of ``path`` relative to ``root``."""
+    parts = list(path.relative_to(root).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts).casefold()
+
+
+def find_problems(root: Path) -> List[str]:
+    """Return a description of every duplicate or conflicted module."""
+    problems = []
+    definitions: Dict[str, List[Path]] = defaultdict(list)
+
+    for path in sorted(root.rglob("*.py")):
+        definitions[module_name(path, root)].append(path)
+        for number, line in enumerate(path.read_text().splitlines(), start=1):
+            if line.startswith(CONFLICT_MARKERS):
+                problems.append(f"{path}:{number}: merge-conflict marker")
+
+    for name, paths in definitions.items():
+        digests = {hashlib.sha256(p.read_bytes()).hexdigest() for p in paths}
+        if len(paths) > 1 and len(digests) > 1:
+            files = ", ".join(str(p) for p in paths)
+            problems.append(f"{name}: defined by multiple files ({files})")
+
+    return problems
+
+
+def main(argv: List[str]) -> int:
+    root = Path(argv[1] if len(argv) > 1 else "src")
+    problems = find_problems(root)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))